@@ -0,0 +1,108 @@
+"""HTTP session and report helpers shared by the backend API test scripts"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any
+
+# (connect, read) timeout applied to every request so a hung server can't stall the run
+DEFAULT_TIMEOUT = (3.0, 10.0)
+
+class TimeoutSession(requests.Session):
+    def request(self, *args, **kwargs):
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        return super().request(*args, **kwargs)
+
+# Retry gateway errors on idempotent methods only; a retried POST could create duplicates.
+# Connection failures are retried for every method since the request was never sent.
+# Once retries run out the last 5xx response is returned, so the test reports it as a failure.
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=["GET", "PUT", "DELETE"],
+    raise_on_status=False
+)
+
+# Shared session so all calls reuse pooled keep-alive connections
+SESSION = TimeoutSession()
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=RETRY))
+# The backend gzips only bodies of 1 KB or more, so small responses arrive uncompressed
+SESSION.headers.update({"Content-Type": "application/json", "Accept-Encoding": "gzip"})
+
+# Worker threads for independent tests; stays below the session's pool size
+EXECUTOR = ThreadPoolExecutor(max_workers=10)
+
+# Report lines, written to stdout in one go when the run ends. Tests running
+# under run_parallel collect into a thread-local list first so their results
+# keep call order.
+OUTPUT: List[str] = []
+CAPTURE = threading.local()
+
+def report(text: str = ""):
+    """Queue a line of output (like print) for the final write"""
+    lines = getattr(CAPTURE, "lines", None)
+    (OUTPUT if lines is None else lines).append(text)
+
+def flush_report():
+    if OUTPUT:
+        sys.stdout.write("\n".join(OUTPUT) + "\n")
+        sys.stdout.flush()
+        OUTPUT.clear()
+
+def print_test_result(test_name: str, success: bool, details: str = ""):
+    status = "✅ PASSED" if success else "❌ FAILED"
+    report(f"{status} - {test_name}")
+    if details:
+        report(f"  Details: {details}")
+    report()
+
+def run_captured(function, *args):
+    CAPTURE.lines = []
+    try:
+        return function(*args), CAPTURE.lines
+    finally:
+        CAPTURE.lines = None
+
+def submit_parallel(*calls):
+    """Start independent (function, *args) calls on the worker pool, capturing their report lines"""
+    return [EXECUTOR.submit(run_captured, *call) for call in calls]
+
+def collect_parallel(futures):
+    """Wait for submit_parallel calls; report their lines and return their results in call order"""
+    results = []
+    for future in futures:
+        result, lines = future.result()
+        OUTPUT.extend(lines)
+        results.append(result)
+    return results
+
+def run_parallel(*calls):
+    """Run independent (function, *args) calls concurrently; return their results in call order"""
+    return collect_parallel(submit_parallel(*calls))
+
+@functools.lru_cache(maxsize=8)
+def get_headers(token: str) -> Dict[str, str]:
+    """Return headers with authorization token (Content-Type is set on SESSION)
+
+    Cached per token; callers must not mutate the returned dict.
+    """
+    return {
+        "Authorization": f"Bearer {token}"
+    }
+
+def fails_on_request_error(test_name: str, failed_result: Any = False):
+    """Report a timeout or connection error in a hand-written test as its failure"""
+    def decorator(test):
+        @functools.wraps(test)
+        def wrapper(*args, **kwargs):
+            try:
+                return test(*args, **kwargs)
+            except requests.RequestException as e:
+                print_test_result(test_name, False, f"Request error: {e}")
+                return failed_result
+        return wrapper
+    return decorator
@@ -1,22 +1,52 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from pymongo import MongoClient
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Callable, List, Literal, Optional
+from cachetools import TTLCache
+import asyncio
 import bcrypt
 import jwt
+import orjson
 import uuid
 from datetime import datetime, timedelta
+import base64
+import hashlib
+import logging
 import os
-from bson import ObjectId
+import re
+import secrets
+import time
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import OperationFailure
+from bson import ObjectId, Regex
+
+logger = logging.getLogger(__name__)
 
 # Environment variables
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017/')
 JWT_SECRET = os.environ.get('JWT_SECRET', 'fallback-secret-key')
+BCRYPT_COST = int(os.environ.get('BCRYPT_COST', 10))
+MONGO_POOL_SIZE = int(os.environ.get('MONGO_POOL_SIZE', 50))
+MAX_PAGE_SIZE = 200
+LIST_BATCH_SIZE = 1000  # cursor batch size for unbounded admin and catalogue listings
+CORS_ORIGINS = [origin.strip() for origin in os.environ.get('CORS_ORIGINS', 'http://localhost:3000').split(',') if origin.strip()]
 
 # MongoDB connection
-client = MongoClient(MONGO_URL)
+client = AsyncIOMotorClient(
+    MONGO_URL,
+    maxPoolSize=MONGO_POOL_SIZE,
+    minPoolSize=min(10, MONGO_POOL_SIZE),
+    maxIdleTimeMS=60000,  # recycle sockets left idle after a burst
+    waitQueueTimeoutMS=2000,  # fail fast instead of stalling when the pool is exhausted
+    serverSelectionTimeoutMS=5000,
+    retryWrites=True,
+    compressors="zstd",
+)
 db = client.ecommerce
 
 # Collections
@@ -31,20 +61,63 @@ shipments_collection = db.shipments
 delivery_routes_collection = db.delivery_routes
 
 # FastAPI app
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
+# Compress larger responses such as the product and order lists
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Security
 security = HTTPBearer()
 
+# HS256 key prepared once; decoding with a PyJWK skips the per-call algorithm lookup and key preparation
+JWT_KEY = jwt.PyJWK(
+    {"kty": "oct", "k": base64.urlsafe_b64encode(JWT_SECRET.encode('utf-8')).rstrip(b'=').decode('ascii')},
+    algorithm='HS256'
+)
+
+# Verified tokens keyed by a digest of the token: (user_id, role, exp)
+TOKEN_CACHE_TTL = 30  # seconds
+token_cache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL)
+
+# User roles keyed by user_id, for tokens that carry no role claim
+ROLE_CACHE_TTL = 60  # seconds
+role_cache = TTLCache(maxsize=5000, ttl=ROLE_CACHE_TTL)
+
+# Read-through caches for rarely changing documents, keyed by id
+CATALOG_CACHE_TTL = 60  # seconds
+product_cache = TTLCache(maxsize=20000, ttl=CATALOG_CACHE_TTL)
+provider_cache = TTLCache(maxsize=1000, ttl=CATALOG_CACHE_TTL)
+category_name_cache = TTLCache(maxsize=1000, ttl=CATALOG_CACHE_TTL)
+category_list_cache = TTLCache(maxsize=1, ttl=CATALOG_CACHE_TTL)
+# Bumped on every category write, so a list read before the write is not cached after it
+category_list_generation = 0
+
+# Serialized /api/products responses keyed by query parameters
+product_list_cache = TTLCache(maxsize=512, ttl=CATALOG_CACHE_TTL)
+# Bumped on every product write, so a listing read before the write is not cached after it
+product_list_generation = 0
+
+# Active transportation providers, preloaded at startup and reloaded after
+# provider writes (or once stale, to pick up writes made by other workers)
+active_providers: List[dict] = []
+active_providers_loaded_at = 0.0
+
+# Allowed status values, validated by pydantic-core during request parsing
+OrderStatus = Literal["pending", "confirmed", "shipped", "delivered", "completed", "cancelled"]
+ShipmentStatus = Literal["pending", "assigned", "picked_up", "in_transit", "out_for_delivery", "delivered", "returned"]
+RouteStatus = Literal["planned", "in_progress", "completed"]
+ServiceType = Literal["standard", "express", "overnight", "economy", "local"]
+
 # Pydantic models
 class User(BaseModel):
     id: str
@@ -102,7 +175,7 @@ class Order(BaseModel):
     items: List[dict]
     total_amount: float
     transportation_cost: float = 0.0
-    status: str
+    status: OrderStatus
     created_at: datetime
     shipping_address: str
     user_name: str
@@ -116,7 +189,7 @@ class OrderCreate(BaseModel):
 class TransportationProvider(BaseModel):
     id: str
     name: str
-    service_type: str  # "standard", "express", "overnight"
+    service_type: ServiceType
     base_cost: float
     cost_per_km: float
     estimated_days: int
@@ -125,7 +198,7 @@ class TransportationProvider(BaseModel):
 
 class TransportationProviderCreate(BaseModel):
     name: str
-    service_type: str
+    service_type: ServiceType
     base_cost: float
     cost_per_km: float
     estimated_days: int
@@ -155,7 +228,7 @@ class Shipment(BaseModel):
     provider_id: str
     vehicle_id: str
     tracking_number: str
-    status: str  # "pending", "assigned", "picked_up", "in_transit", "out_for_delivery", "delivered", "returned"
+    status: ShipmentStatus
     estimated_delivery: datetime
     actual_delivery: Optional[datetime] = None
     delivery_notes: str = ""
@@ -166,7 +239,7 @@ class ShipmentCreate(BaseModel):
     provider_id: str
 
 class ShipmentUpdate(BaseModel):
-    status: str
+    status: ShipmentStatus
     delivery_notes: str = ""
 
 class DeliveryRoute(BaseModel):
@@ -174,7 +247,7 @@ class DeliveryRoute(BaseModel):
     vehicle_id: str
     date: datetime
     shipments: List[str]  # shipment IDs
-    route_status: str  # "planned", "in_progress", "completed"
+    route_status: RouteStatus
     total_distance: float
     estimated_duration: int  # minutes
     created_at: datetime
@@ -186,52 +259,237 @@ class DeliveryRouteCreate(BaseModel):
     total_distance: float
     estimated_duration: int
 
+# Projections returning only the fields each response model needs
+def model_projection(model) -> dict:
+    projection = {name: 1 for name in model.model_fields}
+    projection["_id"] = 0
+    return projection
+
+USER_FIELDS = model_projection(User)
+PRODUCT_FIELDS = model_projection(Product)
+CATEGORY_FIELDS = model_projection(Category)
+ORDER_FIELDS = model_projection(Order)
+PROVIDER_FIELDS = model_projection(TransportationProvider)
+VEHICLE_FIELDS = model_projection(Vehicle)
+SHIPMENT_FIELDS = model_projection(Shipment)
+ROUTE_FIELDS = model_projection(DeliveryRoute)
+
 # Helper functions
+def new_id() -> str:
+    """Return a UUIDv7 string; ids sort by creation time, so inserts append to the id indexes"""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_COST)).decode('utf-8')
 
 def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
-def create_token(user_id: str) -> str:
+def create_token(user_id: str, role: str) -> str:
     payload = {
         'user_id': user_id,
+        'role': role,
         'exp': datetime.utcnow() + timedelta(days=7)
     }
     return jwt.encode(payload, JWT_SECRET, algorithm='HS256')
 
-def verify_token(token: str) -> str:
+def verify_token(token: str) -> tuple:
+    """Return (user_id, role); role is None for tokens issued without a role claim"""
+    # Skip the HMAC check for tokens verified within the last TOKEN_CACHE_TTL seconds
+    cache_key = hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+    cached = token_cache.get(cache_key)
+    if cached and cached[2] > time.time():
+        return cached[0], cached[1]
+
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
-        return payload['user_id']
+        payload = jwt.decode(token, JWT_KEY, algorithms=['HS256'])
     except jwt.ExpiredSignatureError:
+        token_cache.pop(cache_key, None)
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
+        token_cache.pop(cache_key, None)
         raise HTTPException(status_code=401, detail="Invalid token")
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+    token_cache[cache_key] = (payload['user_id'], payload.get('role'), payload['exp'])
+    return payload['user_id'], payload.get('role')
+
+# Async so the token cache is only touched from the event loop thread.
+# FastAPI caches dependency results per request, so routes needing both
+# get_current_user and get_admin_user still verify the token once.
+async def get_principal(credentials: HTTPAuthorizationCredentials = Depends(security)) -> tuple:
     return verify_token(credentials.credentials)
 
-def get_admin_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
-    user_id = verify_token(credentials.credentials)
-    user = users_collection.find_one({"id": user_id})
-    if not user or user.get("role") != "admin":
+async def get_current_user(principal: tuple = Depends(get_principal)) -> str:
+    return principal[0]
+
+async def get_admin_user(principal: tuple = Depends(get_principal)) -> str:
+    user_id, role = principal
+    # Tokens issued before the role claim existed fall back to a (cached) users lookup
+    if role is None:
+        role = role_cache.get(user_id)
+    if role is None:
+        user = await users_collection.find_one({"id": user_id}, {"_id": 0, "role": 1})
+        role = user.get("role") if user else ""
+        role_cache[user_id] = role
+    if role != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     return user_id
 
+def from_db(model, doc):
+    """Build `model` from a trusted document (read from the database or built from validated input), skipping validation"""
+    return model.model_construct(**{name: doc[name] for name in model.model_fields if name in doc})
+
+def paginate(cursor, page: int, page_size: Optional[int]):
+    """Apply optional page/page_size paging; without page_size the full result is returned"""
+    if page_size is None:
+        return cursor
+    return cursor.skip((page - 1) * page_size).limit(page_size)
+
+async def json_list_chunks(docs, model):
+    """Yield documents as chunks of a JSON array shaped like `model`"""
+    defaults = {
+        name: None if field.is_required() else field.default
+        for name, field in model.model_fields.items()
+    }
+    separator = b"["
+    async for doc in docs:
+        yield separator + orjson.dumps({name: doc.get(name, default) for name, default in defaults.items()})
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+def stream_json_list(docs, model) -> StreamingResponse:
+    """Stream documents as a JSON array shaped like `model` without building the list in memory"""
+    return StreamingResponse(json_list_chunks(docs, model), media_type="application/json")
+
+async def cache_chunks(cache: TTLCache, key, chunks, is_current: Callable[[], bool]):
+    """Pass chunks through, storing the complete body in `cache` once fully sent if `is_current()` still holds"""
+    parts = []
+    async for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    if is_current():
+        cache[key] = b"".join(parts)
+
+def invalidate_product_lists():
+    global product_list_generation
+    product_list_generation += 1
+    product_list_cache.clear()
+
+def invalidate_category_list():
+    global category_list_generation
+    category_list_generation += 1
+    category_list_cache.clear()
+
+# Cached lookups; callers must not mutate the returned documents
+async def fetch_products(product_ids: List[str]) -> dict:
+    """Return {product_id: product} for the ids that exist, querying only cache misses"""
+    products_by_id = {}
+    missing = []
+    for product_id in product_ids:
+        product = product_cache.get(product_id)
+        if product is None:
+            missing.append(product_id)
+        else:
+            products_by_id[product_id] = product
+
+    if missing:
+        async for product in products_collection.find({"id": {"$in": missing}}, PRODUCT_FIELDS):
+            product_cache[product["id"]] = product
+            products_by_id[product["id"]] = product
+    return products_by_id
+
+async def reserve_stock(quantities: dict) -> List[str]:
+    """Decrement stock for {product_id: quantity}; on any shortfall or error undo the rest and return the short ids"""
+    product_ids = list(quantities)
+    # The filter only matches while enough stock remains, so concurrent orders cannot oversell.
+    # Exceptions are collected rather than raised so the decrements that did apply can be undone.
+    results = await asyncio.gather(*(
+        products_collection.update_one(
+            {"id": product_id, "stock": {"$gte": quantity}},
+            {"$inc": {"stock": -quantity}}
+        )
+        for product_id, quantity in quantities.items()
+    ), return_exceptions=True)
+    for product_id in product_ids:
+        product_cache.pop(product_id, None)
+
+    errors = [result for result in results if isinstance(result, BaseException)]
+    short_ids = [
+        product_id for product_id, result in zip(product_ids, results)
+        if not isinstance(result, BaseException) and result.modified_count == 0
+    ]
+    if errors or short_ids:
+        reserved = {
+            product_id: quantities[product_id]
+            for product_id, result in zip(product_ids, results)
+            if not isinstance(result, BaseException) and result.modified_count
+        }
+        if reserved:
+            await release_stock(reserved)
+        if errors:
+            raise errors[0]
+    else:
+        # Listings embed stock, so drop the serialized ones
+        invalidate_product_lists()
+    return short_ids
+
+async def release_stock(quantities: dict):
+    """Put {product_id: quantity} taken by reserve_stock back in stock"""
+    await products_collection.bulk_write([
+        UpdateOne({"id": product_id}, {"$inc": {"stock": quantity}})
+        for product_id, quantity in quantities.items()
+    ], ordered=False)
+    for product_id in quantities:
+        product_cache.pop(product_id, None)
+    invalidate_product_lists()
+
+async def fetch_product(product_id: str) -> Optional[dict]:
+    products_by_id = await fetch_products([product_id])
+    return products_by_id.get(product_id)
+
+async def fetch_provider(provider_id: str) -> Optional[dict]:
+    provider = provider_cache.get(provider_id)
+    if provider is None:
+        provider = await transportation_providers_collection.find_one({"id": provider_id}, PROVIDER_FIELDS)
+        if provider:
+            provider_cache[provider_id] = provider
+    return provider
+
+async def fetch_category_name(category_id: str) -> Optional[str]:
+    name = category_name_cache.get(category_id)
+    if name is None:
+        category = await categories_collection.find_one({"id": category_id}, {"_id": 0, "name": 1})
+        if category:
+            name = category_name_cache[category_id] = category["name"]
+    return name
+
+async def reload_active_providers() -> List[dict]:
+    global active_providers, active_providers_loaded_at
+    active_providers = await transportation_providers_collection.find({"active": True}, PROVIDER_FIELDS).to_list(length=None)
+    active_providers_loaded_at = time.monotonic()
+    return active_providers
+
+async def get_active_providers() -> List[dict]:
+    if time.monotonic() - active_providers_loaded_at > CATALOG_CACHE_TTL:
+        return await reload_active_providers()
+    return active_providers
+
 # Transportation helper functions
-def calculate_transportation_cost(shipping_address: str, items: List[dict]) -> dict:
+async def calculate_transportation_cost(shipping_address: str, items: List[dict]) -> dict:
     """Calculate transportation cost based on distance and weight"""
-    import random
-    
-    # Simulate distance calculation (in real scenario, use address parsing)
-    estimated_distance = random.randint(5, 50)  # 5-50 km
+    # Simulate distance calculation (in real scenario, use address parsing);
+    # hashing the address keeps the quote stable for the same address
+    address_hash = hashlib.blake2b(shipping_address.encode('utf-8'), digest_size=4).digest()
+    estimated_distance = 5 + int.from_bytes(address_hash, 'big') % 46  # 5-50 km
     
     # Calculate total weight (simulate based on item count)
     total_weight = sum(item.get('quantity', 1) for item in items)
     
     # Get available providers
-    providers = list(transportation_providers_collection.find({"active": True}))
+    providers = await get_active_providers()
     
     if not providers:
         return {
@@ -241,10 +499,11 @@ def calculate_transportation_cost(shipping_address: str, items: List[dict]) -> d
             "provider_name": "Standard Delivery"
         }
     
-    # Select cheapest provider for the distance
-    best_provider = min(providers, key=lambda p: p["base_cost"] + (p["cost_per_km"] * estimated_distance))
-    
-    cost = best_provider["base_cost"] + (best_provider["cost_per_km"] * estimated_distance)
+    # Select cheapest provider for the distance, pricing each provider once
+    cost, best_provider = min(
+        ((p["base_cost"] + (p["cost_per_km"] * estimated_distance), p) for p in providers),
+        key=lambda priced: priced[0]
+    )
     
     # Add weight factor
     if total_weight > 5:
@@ -260,28 +519,26 @@ def calculate_transportation_cost(shipping_address: str, items: List[dict]) -> d
 
 def generate_tracking_number() -> str:
     """Generate a unique tracking number"""
-    import random
-    import string
     prefix = "TRK"
-    suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+    # 5 random bytes encode to exactly 8 base32 characters (A-Z, 2-7)
+    suffix = base64.b32encode(secrets.token_bytes(5)).decode('ascii')
     return f"{prefix}{suffix}"
 
-def create_shipment_for_order(order_id: str, provider_id: str) -> str:
-    """Create a shipment for an order"""
-    shipment_id = str(uuid.uuid4())
+async def build_shipment_for_order(order_id: str, provider_id: str) -> dict:
+    """Build the shipment document for an order; the caller inserts it"""
     tracking_number = generate_tracking_number()
     
     # Find available vehicle from the provider
-    vehicle = vehicles_collection.find_one({"provider_id": provider_id, "active": True})
+    vehicle = await vehicles_collection.find_one({"provider_id": provider_id, "active": True}, {"_id": 0, "id": 1})
     vehicle_id = vehicle["id"] if vehicle else None
     
     # Calculate estimated delivery (add provider's estimated days)
-    provider = transportation_providers_collection.find_one({"id": provider_id})
+    provider = await fetch_provider(provider_id)
     estimated_days = provider["estimated_days"] if provider else 3
     estimated_delivery = datetime.utcnow() + timedelta(days=estimated_days)
     
     shipment = {
-        "id": shipment_id,
+        "id": new_id(),
         "order_id": order_id,
         "provider_id": provider_id,
         "vehicle_id": vehicle_id,
@@ -293,19 +550,71 @@ def create_shipment_for_order(order_id: str, provider_id: str) -> str:
         "created_at": datetime.utcnow()
     }
     
-    shipments_collection.insert_one(shipment)
-    return shipment_id
+    return shipment
+
+async def insert_order_shipment(order: dict, shipment: dict):
+    """Write the shipment for an already inserted order, setting the order back to pending if that fails"""
+    try:
+        await shipments_collection.insert_one(shipment)
+    except Exception as error:
+        # The order stands without a shipment, so it is back to awaiting assignment
+        logger.warning("Could not create shipment for order %s: %s", order["id"], error)
+        order["status"] = "pending"
+        await orders_collection.update_one({"id": order["id"]}, {"$set": {"status": "pending"}})
+
+# Database indexes
+@app.on_event("startup")
+async def create_indexes():
+    """Create indexes for every lookup key used by the routes"""
+    indexes = [
+        (collection, "id", {"unique": True})
+        for collection in (
+            users_collection,
+            products_collection,
+            categories_collection,
+            orders_collection,
+            transportation_providers_collection,
+            vehicles_collection,
+            shipments_collection,
+            delivery_routes_collection,
+        )
+    ]
+    indexes += [
+        (users_collection, "email", {"unique": True}),
+        (products_collection, "category_id", {}),
+        (products_collection, "name", {}),
+        (products_collection, [("name", "text"), ("description", "text")], {}),
+        (transportation_providers_collection, "active", {}),
+        (vehicles_collection, [("provider_id", 1), ("active", 1)], {}),
+        (cart_collection, [("user_id", 1), ("product_id", 1)], {"unique": True}),
+        (cart_collection, "product_id", {}),
+        (orders_collection, [("user_id", 1), ("created_at", -1)], {}),
+        (orders_collection, "status", {}),
+        (shipments_collection, "tracking_number", {"unique": True}),
+        (shipments_collection, "order_id", {}),
+    ]
+
+    # One bad index (e.g. duplicates blocking a unique index) must not stop the app from starting
+    for collection, keys, options in indexes:
+        try:
+            await collection.create_index(keys, **options)
+        except OperationFailure as error:
+            logger.warning("Could not create index %s on %s: %s", keys, collection.name, error)
+
+@app.on_event("startup")
+async def preload_active_providers():
+    await reload_active_providers()
 
 # Routes
 
 # Auth routes
 @app.post("/api/register")
 async def register(user_data: UserRegister):
-    if users_collection.find_one({"email": user_data.email}):
+    if await users_collection.find_one({"email": user_data.email}, {"_id": 1}):
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    user_id = str(uuid.uuid4())
-    hashed_password = hash_password(user_data.password)
+    user_id = new_id()
+    hashed_password = await run_in_threadpool(hash_password, user_data.password)
     
     user = {
         "id": user_id,
@@ -315,56 +624,99 @@ async def register(user_data: UserRegister):
         "role": "customer"
     }
     
-    users_collection.insert_one(user)
-    token = create_token(user_id)
+    await users_collection.insert_one(user)
+    token = create_token(user_id, user["role"])
     
-    return {"token": token, "user": User(**user)}
+    return {"token": token, "user": from_db(User, user)}
 
 @app.post("/api/login")
 async def login(user_data: UserLogin):
-    user = users_collection.find_one({"email": user_data.email})
-    if not user or not verify_password(user_data.password, user["password"]):
+    user = await users_collection.find_one({"email": user_data.email}, {**USER_FIELDS, "password": 1})
+    if not user or not await run_in_threadpool(verify_password, user_data.password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    token = create_token(user["id"])
-    return {"token": token, "user": User(**user)}
+    token = create_token(user["id"], user.get("role", "customer"))
+    return {"token": token, "user": from_db(User, user)}
 
 @app.get("/api/me")
 async def get_me(user_id: str = Depends(get_current_user)):
-    user = users_collection.find_one({"id": user_id})
+    user = await users_collection.find_one({"id": user_id}, USER_FIELDS)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return User(**user)
+    return from_db(User, user)
 
 # Product routes
 @app.get("/api/products")
-async def get_products(search: Optional[str] = None, category: Optional[str] = None):
+async def get_products(
+    search: Optional[str] = None,
+    category: Optional[str] = None,
+    page: int = Query(1, ge=1),
+    page_size: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE)
+):
+    # Identical listings are requested on every page load; replay the serialized body
+    cache_key = (search, category, page, page_size)
+    cached = product_list_cache.get(cache_key)
+    if cached is not None:
+        return Response(cached, media_type="application/json")
+    generation = product_list_generation
+
     query = {}
+    projection = PRODUCT_FIELDS
     if search:
-        query["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"description": {"$regex": search, "$options": "i"}}
-        ]
+        # Served by the name/description text index instead of a regex scan
+        query["$text"] = {"$search": search}
+        projection = {**PRODUCT_FIELDS, "score": {"$meta": "textScore"}}
     if category:
         query["category_id"] = category
-    
-    products = list(products_collection.find(query))
-    return [Product(**product) for product in products]
+
+    # Large batches fetch a full listing in fewer getMore round-trips
+    cursor = products_collection.find(query, projection).batch_size(LIST_BATCH_SIZE)
+    if search:
+        cursor = cursor.sort([("score", {"$meta": "textScore"})])
+    elif page_size is not None:
+        cursor = cursor.sort("_id", 1)  # stable order across pages
+
+    async def matching_products():
+        found = False
+        async for product in paginate(cursor, page, page_size):
+            found = True
+            yield product
+
+        if search and not found:
+            # An empty later page only means the text matches ran out
+            if page > 1 and await products_collection.find_one(query, {"_id": 1}):
+                return
+            # Partial words miss the text index; fall back to an escaped, anchored name prefix.
+            # Being case-insensitive, the regex gets no tight index bounds: at best MongoDB
+            # scans every key of the name index, so this stays a rarely taken fallback.
+            del query["$text"]
+            query["name"] = Regex(f"^{re.escape(search)}", "i")
+            fallback = products_collection.find(query, PRODUCT_FIELDS).sort("_id", 1)
+            async for product in paginate(fallback, page, page_size):
+                yield product
+
+    body = cache_chunks(
+        product_list_cache,
+        cache_key,
+        json_list_chunks(matching_products(), Product),
+        lambda: product_list_generation == generation
+    )
+    return StreamingResponse(body, media_type="application/json")
 
 @app.get("/api/products/{product_id}")
 async def get_product(product_id: str):
-    product = products_collection.find_one({"id": product_id})
+    product = await fetch_product(product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return Product(**product)
+    return from_db(Product, product)
 
 @app.post("/api/products")
 async def create_product(product_data: ProductCreate, admin_id: str = Depends(get_admin_user)):
-    category = categories_collection.find_one({"id": product_data.category_id})
-    if not category:
+    category_name = await fetch_category_name(product_data.category_id)
+    if category_name is None:
         raise HTTPException(status_code=400, detail="Category not found")
     
-    product_id = str(uuid.uuid4())
+    product_id = new_id()
     product = {
         "id": product_id,
         "name": product_data.name,
@@ -372,17 +724,18 @@ async def create_product(product_data: ProductCreate, admin_id: str = Depends(ge
         "price": product_data.price,
         "image_url": product_data.image_url,
         "category_id": product_data.category_id,
-        "category_name": category["name"],
+        "category_name": category_name,
         "stock": product_data.stock
     }
     
-    products_collection.insert_one(product)
-    return Product(**product)
+    await products_collection.insert_one(product)
+    invalidate_product_lists()
+    return from_db(Product, product)
 
 @app.put("/api/products/{product_id}")
 async def update_product(product_id: str, product_data: ProductCreate, admin_id: str = Depends(get_admin_user)):
-    category = categories_collection.find_one({"id": product_data.category_id})
-    if not category:
+    category_name = await fetch_category_name(product_data.category_id)
+    if category_name is None:
         raise HTTPException(status_code=400, detail="Category not found")
     
     update_data = {
@@ -391,45 +744,70 @@ async def update_product(product_id: str, product_data: ProductCreate, admin_id:
         "price": product_data.price,
         "image_url": product_data.image_url,
         "category_id": product_data.category_id,
-        "category_name": category["name"],
+        "category_name": category_name,
         "stock": product_data.stock
     }
     
-    result = products_collection.update_one({"id": product_id}, {"$set": update_data})
-    if result.matched_count == 0:
+    product = await products_collection.find_one_and_update(
+        {"id": product_id},
+        {"$set": update_data},
+        projection=PRODUCT_FIELDS,
+        return_document=ReturnDocument.AFTER
+    )
+    if not product:
         raise HTTPException(status_code=404, detail="Product not found")
+    product_cache.pop(product_id, None)
+    invalidate_product_lists()
     
-    product = products_collection.find_one({"id": product_id})
-    return Product(**product)
+    # Refresh the product snapshot stored in cart items
+    snapshot = {name: product[name] for name in Product.model_fields if name in product}
+    await cart_collection.update_many({"product_id": product_id}, {"$set": {"product": snapshot}})
+    
+    return from_db(Product, product)
 
 @app.delete("/api/products/{product_id}")
 async def delete_product(product_id: str, admin_id: str = Depends(get_admin_user)):
-    result = products_collection.delete_one({"id": product_id})
+    result = await products_collection.delete_one({"id": product_id})
+    product_cache.pop(product_id, None)
+    invalidate_product_lists()
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Product not found")
+    
+    # Carts hold a snapshot of the product, so drop it from carts explicitly
+    await cart_collection.delete_many({"product_id": product_id})
     return {"message": "Product deleted successfully"}
 
 # Category routes
 @app.get("/api/categories")
 async def get_categories():
-    categories = list(categories_collection.find())
-    return [Category(**category) for category in categories]
+    # The category list is small and requested on every page load, so serve it pre-serialized from memory
+    body = category_list_cache.get("all")
+    if body is None:
+        generation = category_list_generation
+        categories = await categories_collection.find({}, CATEGORY_FIELDS).to_list(length=None)
+        body = orjson.dumps(categories)
+        if category_list_generation == generation:
+            category_list_cache["all"] = body
+    return Response(body, media_type="application/json")
 
 @app.post("/api/categories")
 async def create_category(category_data: CategoryCreate, admin_id: str = Depends(get_admin_user)):
-    category_id = str(uuid.uuid4())
+    category_id = new_id()
     category = {
         "id": category_id,
         "name": category_data.name,
         "description": category_data.description
     }
     
-    categories_collection.insert_one(category)
-    return Category(**category)
+    await categories_collection.insert_one(category)
+    invalidate_category_list()
+    return from_db(Category, category)
 
 @app.delete("/api/categories/{category_id}")
 async def delete_category(category_id: str, admin_id: str = Depends(get_admin_user)):
-    result = categories_collection.delete_one({"id": category_id})
+    result = await categories_collection.delete_one({"id": category_id})
+    invalidate_category_list()
+    category_name_cache.pop(category_id, None)
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Category not found")
     return {"message": "Category deleted successfully"}
@@ -437,49 +815,47 @@ async def delete_category(category_id: str, admin_id: str = Depends(get_admin_us
 # Cart routes
 @app.get("/api/cart")
 async def get_cart(user_id: str = Depends(get_current_user)):
-    cart_items = list(cart_collection.find({"user_id": user_id}))
+    cart_items = await cart_collection.find(
+        {"user_id": user_id},
+        {"_id": 0, "product_id": 1, "quantity": 1, "product": 1}
+    ).to_list(length=None)
     
-    # Get product details for each cart item
+    # Cart items carry a product snapshot; only items saved without one need a lookup
+    products_by_id = await fetch_products([item["product_id"] for item in cart_items if "product" not in item])
+
     cart_with_products = []
     for item in cart_items:
-        product = products_collection.find_one({"id": item["product_id"]})
+        product = item.get("product") or products_by_id.get(item["product_id"])
         if product:
             cart_with_products.append({
                 "product_id": item["product_id"],
                 "quantity": item["quantity"],
-                "product": Product(**product)
+                "product": from_db(Product, product)
             })
     
     return cart_with_products
 
 @app.post("/api/cart")
 async def add_to_cart(item: CartAdd, user_id: str = Depends(get_current_user)):
-    product = products_collection.find_one({"id": item.product_id})
+    product = await fetch_product(item.product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    existing_item = cart_collection.find_one({"user_id": user_id, "product_id": item.product_id})
-    
-    if existing_item:
-        cart_collection.update_one(
-            {"user_id": user_id, "product_id": item.product_id},
-            {"$inc": {"quantity": item.quantity}}
-        )
-    else:
-        cart_collection.insert_one({
-            "user_id": user_id,
-            "product_id": item.product_id,
-            "quantity": item.quantity
-        })
+    # Upsert increments an existing line or creates it (user_id/product_id come from the filter)
+    await cart_collection.update_one(
+        {"user_id": user_id, "product_id": item.product_id},
+        {"$inc": {"quantity": item.quantity}, "$set": {"product": product}},
+        upsert=True
+    )
     
     return {"message": "Item added to cart"}
 
 @app.put("/api/cart/{product_id}")
 async def update_cart_item(product_id: str, quantity: int, user_id: str = Depends(get_current_user)):
     if quantity <= 0:
-        cart_collection.delete_one({"user_id": user_id, "product_id": product_id})
+        await cart_collection.delete_one({"user_id": user_id, "product_id": product_id})
     else:
-        cart_collection.update_one(
+        await cart_collection.update_one(
             {"user_id": user_id, "product_id": product_id},
             {"$set": {"quantity": quantity}}
         )
@@ -488,25 +864,34 @@ async def update_cart_item(product_id: str, quantity: int, user_id: str = Depend
 
 @app.delete("/api/cart/{product_id}")
 async def remove_from_cart(product_id: str, user_id: str = Depends(get_current_user)):
-    cart_collection.delete_one({"user_id": user_id, "product_id": product_id})
+    await cart_collection.delete_one({"user_id": user_id, "product_id": product_id})
     return {"message": "Item removed from cart"}
 
 # Order routes
 @app.post("/api/orders")
 async def create_order(order_data: OrderCreate, user_id: str = Depends(get_current_user)):
-    user = users_collection.find_one({"id": user_id})
+    # Fetch the user and every referenced product concurrently
+    product_ids = [item.product_id for item in order_data.items]
+    user, products_by_id = await asyncio.gather(
+        users_collection.find_one({"id": user_id}, {"_id": 0, "name": 1, "email": 1}),
+        fetch_products(product_ids)
+    )
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
+    # Reject unknown product ids and non-positive quantities before pricing
+    missing_ids = [product_id for product_id in product_ids if product_id not in products_by_id]
+    if missing_ids:
+        raise HTTPException(status_code=404, detail=f"Product {missing_ids[0]} not found")
+    if any(item.quantity < 1 for item in order_data.items):
+        raise HTTPException(status_code=400, detail="Quantity must be at least 1")
+    
     # Calculate total and prepare order items
     order_items = []
     subtotal = 0
     
     for item in order_data.items:
-        product = products_collection.find_one({"id": item.product_id})
-        if not product:
-            raise HTTPException(status_code=404, detail=f"Product {item.product_id} not found")
-        
+        product = products_by_id[item.product_id]
         item_total = product["price"] * item.quantity
         subtotal += item_total
         
@@ -519,11 +904,11 @@ async def create_order(order_data: OrderCreate, user_id: str = Depends(get_curre
         })
     
     # Calculate transportation cost
-    transport_info = calculate_transportation_cost(order_data.shipping_address, order_items)
+    transport_info = await calculate_transportation_cost(order_data.shipping_address, order_items)
     transportation_cost = transport_info["cost"]
     total_amount = subtotal + transportation_cost
     
-    order_id = str(uuid.uuid4())
+    order_id = new_id()
     order = {
         "id": order_id,
         "user_id": user_id,
@@ -537,54 +922,83 @@ async def create_order(order_data: OrderCreate, user_id: str = Depends(get_curre
         "shipping_address": order_data.shipping_address
     }
     
-    orders_collection.insert_one(order)
+    # Take the ordered quantities out of stock before writing the order
+    quantities = {}
+    for item in order_data.items:
+        quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
+    short_ids = await reserve_stock(quantities)
+    if short_ids:
+        raise HTTPException(status_code=409, detail=f"Insufficient stock for product {short_ids[0]}")
     
-    # Create shipment if provider is available
-    if transport_info["provider_id"]:
-        shipment_id = create_shipment_for_order(order_id, transport_info["provider_id"])
-        # Update order status to show it's been assigned for shipping
-        orders_collection.update_one(
-            {"id": order_id},
-            {"$set": {"status": "confirmed"}}
-        )
-        order["status"] = "confirmed"
+    # Until the order is written the reservation is owned by this request; give it back on failure
+    shipment = None
+    try:
+        # Create shipment if provider is available
+        if transport_info["provider_id"]:
+            shipment = await build_shipment_for_order(order_id, transport_info["provider_id"])
+            # Store the order as confirmed to show it's been assigned for shipping
+            order["status"] = "confirmed"
+        
+        await orders_collection.insert_one(order)
+    except Exception:
+        await release_stock(quantities)
+        raise
     
-    # Clear cart
-    cart_collection.delete_many({"user_id": user_id})
+    # The shipment references the order and the cart is cleared only for a placed order,
+    # so both follow the order insert; they touch different collections and run concurrently
+    follow_up = [cart_collection.delete_many({"user_id": user_id})]
+    if shipment:
+        follow_up.append(insert_order_shipment(order, shipment))
+    await asyncio.gather(*follow_up)
     
-    return Order(**order)
+    return from_db(Order, order)
 
 @app.get("/api/orders")
-async def get_orders(user_id: str = Depends(get_current_user)):
-    orders = list(orders_collection.find({"user_id": user_id}).sort("created_at", -1))
-    return [Order(**order) for order in orders]
+async def get_orders(
+    page: int = Query(1, ge=1),
+    page_size: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    user_id: str = Depends(get_current_user)
+):
+    cursor = orders_collection.find({"user_id": user_id}, ORDER_FIELDS).sort("created_at", -1)
+    return stream_json_list(paginate(cursor, page, page_size), Order)
 
 @app.get("/api/admin/orders")
-async def get_all_orders(admin_id: str = Depends(get_admin_user)):
-    orders = list(orders_collection.find().sort("created_at", -1))
-    return [Order(**order) for order in orders]
+async def get_all_orders(
+    page: int = Query(1, ge=1),
+    page_size: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    admin_id: str = Depends(get_admin_user)
+):
+    cursor = orders_collection.find({}, ORDER_FIELDS).sort("created_at", -1).batch_size(LIST_BATCH_SIZE)
+    return stream_json_list(paginate(cursor, page, page_size), Order)
 
 @app.put("/api/admin/orders/{order_id}")
-async def update_order_status(order_id: str, status: str, admin_id: str = Depends(get_admin_user)):
-    result = orders_collection.update_one(
+async def update_order_status(order_id: str, status: OrderStatus, admin_id: str = Depends(get_admin_user)):
+    order = await orders_collection.find_one_and_update(
         {"id": order_id},
-        {"$set": {"status": status}}
+        {"$set": {"status": status}},
+        projection=ORDER_FIELDS,
+        return_document=ReturnDocument.AFTER
     )
-    if result.matched_count == 0:
+    if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     
-    order = orders_collection.find_one({"id": order_id})
-    return Order(**order)
+    return from_db(Order, order)
 
 @app.get("/api/admin/stats")
 async def get_admin_stats(admin_id: str = Depends(get_admin_user)):
-    total_products = products_collection.count_documents({})
-    total_orders = orders_collection.count_documents({})
-    total_users = users_collection.count_documents({"role": "customer"})
-    
-    # Calculate total revenue
-    orders = list(orders_collection.find({"status": {"$in": ["completed", "pending"]}}))
-    total_revenue = sum(order["total_amount"] for order in orders)
+    # The counts and the revenue aggregation are independent, so run them concurrently
+    total_products, total_orders, total_users, revenue = await asyncio.gather(
+        # Unfiltered totals come from collection metadata rather than a count scan
+        products_collection.estimated_document_count(),
+        orders_collection.estimated_document_count(),
+        users_collection.count_documents({"role": "customer"}),
+        # Calculate total revenue on the server instead of pulling every order
+        orders_collection.aggregate([
+            {"$match": {"status": {"$in": ["completed", "pending"]}}},
+            {"$group": {"_id": None, "total": {"$sum": "$total_amount"}}}
+        ]).to_list(length=1)
+    )
+    total_revenue = revenue[0]["total"] if revenue else 0
     
     return {
         "total_products": total_products,
@@ -598,12 +1012,11 @@ async def get_admin_stats(admin_id: str = Depends(get_admin_user)):
 # Transportation Providers
 @app.get("/api/admin/transportation/providers")
 async def get_transportation_providers(admin_id: str = Depends(get_admin_user)):
-    providers = list(transportation_providers_collection.find())
-    return [TransportationProvider(**provider) for provider in providers]
+    return stream_json_list(transportation_providers_collection.find({}, PROVIDER_FIELDS), TransportationProvider)
 
 @app.post("/api/admin/transportation/providers")
 async def create_transportation_provider(provider_data: TransportationProviderCreate, admin_id: str = Depends(get_admin_user)):
-    provider_id = str(uuid.uuid4())
+    provider_id = new_id()
     provider = {
         "id": provider_id,
         "name": provider_data.name,
@@ -615,8 +1028,9 @@ async def create_transportation_provider(provider_data: TransportationProviderCr
         "active": True
     }
     
-    transportation_providers_collection.insert_one(provider)
-    return TransportationProvider(**provider)
+    await transportation_providers_collection.insert_one(provider)
+    await reload_active_providers()
+    return from_db(TransportationProvider, provider)
 
 @app.put("/api/admin/transportation/providers/{provider_id}")
 async def update_transportation_provider(provider_id: str, provider_data: TransportationProviderCreate, admin_id: str = Depends(get_admin_user)):
@@ -629,37 +1043,44 @@ async def update_transportation_provider(provider_id: str, provider_data: Transp
         "service_areas": provider_data.service_areas
     }
     
-    result = transportation_providers_collection.update_one({"id": provider_id}, {"$set": update_data})
-    if result.matched_count == 0:
+    provider = await transportation_providers_collection.find_one_and_update(
+        {"id": provider_id},
+        {"$set": update_data},
+        projection=PROVIDER_FIELDS,
+        return_document=ReturnDocument.AFTER
+    )
+    if not provider:
         raise HTTPException(status_code=404, detail="Transportation provider not found")
+    provider_cache.pop(provider_id, None)
+    await reload_active_providers()
     
-    provider = transportation_providers_collection.find_one({"id": provider_id})
-    return TransportationProvider(**provider)
+    return from_db(TransportationProvider, provider)
 
 @app.delete("/api/admin/transportation/providers/{provider_id}")
 async def delete_transportation_provider(provider_id: str, admin_id: str = Depends(get_admin_user)):
-    result = transportation_providers_collection.update_one(
+    result = await transportation_providers_collection.update_one(
         {"id": provider_id}, 
         {"$set": {"active": False}}
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Transportation provider not found")
+    provider_cache.pop(provider_id, None)
+    await reload_active_providers()
     return {"message": "Transportation provider deactivated successfully"}
 
 # Vehicles
 @app.get("/api/admin/transportation/vehicles")
 async def get_vehicles(admin_id: str = Depends(get_admin_user)):
-    vehicles = list(vehicles_collection.find())
-    return [Vehicle(**vehicle) for vehicle in vehicles]
+    return stream_json_list(vehicles_collection.find({}, VEHICLE_FIELDS), Vehicle)
 
 @app.post("/api/admin/transportation/vehicles")
 async def create_vehicle(vehicle_data: VehicleCreate, admin_id: str = Depends(get_admin_user)):
     # Verify provider exists
-    provider = transportation_providers_collection.find_one({"id": vehicle_data.provider_id})
+    provider = await transportation_providers_collection.find_one({"id": vehicle_data.provider_id}, {"_id": 1})
     if not provider:
         raise HTTPException(status_code=404, detail="Transportation provider not found")
     
-    vehicle_id = str(uuid.uuid4())
+    vehicle_id = new_id()
     vehicle = {
         "id": vehicle_id,
         "provider_id": vehicle_data.provider_id,
@@ -671,8 +1092,8 @@ async def create_vehicle(vehicle_data: VehicleCreate, admin_id: str = Depends(ge
         "active": True
     }
     
-    vehicles_collection.insert_one(vehicle)
-    return Vehicle(**vehicle)
+    await vehicles_collection.insert_one(vehicle)
+    return from_db(Vehicle, vehicle)
 
 @app.put("/api/admin/transportation/vehicles/{vehicle_id}")
 async def update_vehicle(vehicle_id: str, vehicle_data: VehicleCreate, admin_id: str = Depends(get_admin_user)):
@@ -685,16 +1106,20 @@ async def update_vehicle(vehicle_id: str, vehicle_data: VehicleCreate, admin_id:
         "current_location": vehicle_data.current_location
     }
     
-    result = vehicles_collection.update_one({"id": vehicle_id}, {"$set": update_data})
-    if result.matched_count == 0:
+    vehicle = await vehicles_collection.find_one_and_update(
+        {"id": vehicle_id},
+        {"$set": update_data},
+        projection=VEHICLE_FIELDS,
+        return_document=ReturnDocument.AFTER
+    )
+    if not vehicle:
         raise HTTPException(status_code=404, detail="Vehicle not found")
     
-    vehicle = vehicles_collection.find_one({"id": vehicle_id})
-    return Vehicle(**vehicle)
+    return from_db(Vehicle, vehicle)
 
 @app.delete("/api/admin/transportation/vehicles/{vehicle_id}")
 async def delete_vehicle(vehicle_id: str, admin_id: str = Depends(get_admin_user)):
-    result = vehicles_collection.update_one(
+    result = await vehicles_collection.update_one(
         {"id": vehicle_id}, 
         {"$set": {"active": False}}
     )
@@ -705,50 +1130,49 @@ async def delete_vehicle(vehicle_id: str, admin_id: str = Depends(get_admin_user
 # Shipments
 @app.get("/api/admin/transportation/shipments")
 async def get_all_shipments(admin_id: str = Depends(get_admin_user)):
-    shipments = list(shipments_collection.find().sort("created_at", -1))
-    return [Shipment(**shipment) for shipment in shipments]
+    return stream_json_list(shipments_collection.find({}, SHIPMENT_FIELDS).sort("created_at", -1), Shipment)
 
 @app.get("/api/shipments/track/{tracking_number}")
 async def track_shipment(tracking_number: str):
-    shipment = shipments_collection.find_one({"tracking_number": tracking_number})
+    shipment = await shipments_collection.find_one({"tracking_number": tracking_number}, SHIPMENT_FIELDS)
     if not shipment:
         raise HTTPException(status_code=404, detail="Shipment not found")
     
     # Get additional info
-    order = orders_collection.find_one({"id": shipment["order_id"]})
-    provider = transportation_providers_collection.find_one({"id": shipment["provider_id"]})
-    vehicle = vehicles_collection.find_one({"id": shipment["vehicle_id"]}) if shipment["vehicle_id"] else None
+    order = await orders_collection.find_one({"id": shipment["order_id"]}, ORDER_FIELDS)
+    provider = await transportation_providers_collection.find_one({"id": shipment["provider_id"]}, PROVIDER_FIELDS)
+    vehicle = await vehicles_collection.find_one({"id": shipment["vehicle_id"]}, VEHICLE_FIELDS) if shipment["vehicle_id"] else None
     
-    result = Shipment(**shipment)
+    result = from_db(Shipment, shipment)
     
     return {
         "shipment": result,
-        "order": Order(**order) if order else None,
-        "provider": TransportationProvider(**provider) if provider else None,
-        "vehicle": Vehicle(**vehicle) if vehicle else None
+        "order": from_db(Order, order) if order else None,
+        "provider": from_db(TransportationProvider, provider) if provider else None,
+        "vehicle": from_db(Vehicle, vehicle) if vehicle else None
     }
 
 @app.get("/api/orders/{order_id}/shipment")
 async def get_order_shipment(order_id: str, user_id: str = Depends(get_current_user)):
     # Verify order belongs to user
-    order = orders_collection.find_one({"id": order_id, "user_id": user_id})
+    order = await orders_collection.find_one({"id": order_id, "user_id": user_id}, {"_id": 1})
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     
-    shipment = shipments_collection.find_one({"order_id": order_id})
+    shipment = await shipments_collection.find_one({"order_id": order_id}, SHIPMENT_FIELDS)
     if not shipment:
         raise HTTPException(status_code=404, detail="Shipment not found")
     
     # Get additional info
-    provider = transportation_providers_collection.find_one({"id": shipment["provider_id"]})
-    vehicle = vehicles_collection.find_one({"id": shipment["vehicle_id"]}) if shipment["vehicle_id"] else None
+    provider = await transportation_providers_collection.find_one({"id": shipment["provider_id"]}, PROVIDER_FIELDS)
+    vehicle = await vehicles_collection.find_one({"id": shipment["vehicle_id"]}, VEHICLE_FIELDS) if shipment["vehicle_id"] else None
     
-    result = Shipment(**shipment)
+    result = from_db(Shipment, shipment)
     
     return {
         "shipment": result,
-        "provider": TransportationProvider(**provider) if provider else None,
-        "vehicle": Vehicle(**vehicle) if vehicle else None
+        "provider": from_db(TransportationProvider, provider) if provider else None,
+        "vehicle": from_db(Vehicle, vehicle) if vehicle else None
     }
 
 @app.put("/api/admin/transportation/shipments/{shipment_id}")
@@ -761,44 +1185,51 @@ async def update_shipment_status(shipment_id: str, shipment_update: ShipmentUpda
     # If status is delivered, set actual delivery time
     if shipment_update.status == "delivered":
         update_data["actual_delivery"] = datetime.utcnow()
-        
-        # Also update the order status
-        shipment = shipments_collection.find_one({"id": shipment_id})
-        if shipment:
-            orders_collection.update_one(
-                {"id": shipment["order_id"]},
-                {"$set": {"status": "delivered"}}
-            )
-    
-    result = shipments_collection.update_one({"id": shipment_id}, {"$set": update_data})
-    if result.matched_count == 0:
+    
+    shipment = await shipments_collection.find_one_and_update(
+        {"id": shipment_id},
+        {"$set": update_data},
+        projection=SHIPMENT_FIELDS,
+        return_document=ReturnDocument.AFTER
+    )
+    if not shipment:
         raise HTTPException(status_code=404, detail="Shipment not found")
     
-    shipment = shipments_collection.find_one({"id": shipment_id})
-    return Shipment(**shipment)
+    # Also update the order status
+    if shipment_update.status == "delivered":
+        await orders_collection.update_one(
+            {"id": shipment["order_id"]},
+            {"$set": {"status": "delivered"}}
+        )
+    
+    return from_db(Shipment, shipment)
 
 # Delivery Routes
 @app.get("/api/admin/transportation/routes")
 async def get_delivery_routes(admin_id: str = Depends(get_admin_user)):
-    routes = list(delivery_routes_collection.find().sort("date", -1))
-    return [DeliveryRoute(**route) for route in routes]
+    return stream_json_list(delivery_routes_collection.find({}, ROUTE_FIELDS).sort("date", -1), DeliveryRoute)
 
 @app.post("/api/admin/transportation/routes")
 async def create_delivery_route(route_data: DeliveryRouteCreate, admin_id: str = Depends(get_admin_user)):
     # Verify vehicle exists
-    vehicle = vehicles_collection.find_one({"id": route_data.vehicle_id})
+    vehicle = await vehicles_collection.find_one({"id": route_data.vehicle_id}, {"_id": 1})
     if not vehicle:
         raise HTTPException(status_code=404, detail="Vehicle not found")
     
     # Verify all shipments exist and are available
+    shipments = await shipments_collection.find(
+        {"id": {"$in": route_data.shipments}},
+        {"_id": 0, "id": 1, "status": 1}
+    ).to_list(length=None)
+    shipment_statuses = {shipment["id"]: shipment["status"] for shipment in shipments}
     for shipment_id in route_data.shipments:
-        shipment = shipments_collection.find_one({"id": shipment_id})
-        if not shipment:
+        if shipment_id not in shipment_statuses:
             raise HTTPException(status_code=404, detail=f"Shipment {shipment_id} not found")
-        if shipment["status"] not in ["pending", "assigned"]:
+    for shipment_id, shipment_status in shipment_statuses.items():
+        if shipment_status not in ["pending", "assigned"]:
             raise HTTPException(status_code=400, detail=f"Shipment {shipment_id} is not available for routing")
     
-    route_id = str(uuid.uuid4())
+    route_id = new_id()
     route = {
         "id": route_id,
         "vehicle_id": route_data.vehicle_id,
@@ -810,54 +1241,54 @@ async def create_delivery_route(route_data: DeliveryRouteCreate, admin_id: str =
         "created_at": datetime.utcnow()
     }
     
-    delivery_routes_collection.insert_one(route)
-    
-    # Update shipments status to assigned
-    shipments_collection.update_many(
-        {"id": {"$in": route_data.shipments}},
-        {"$set": {"status": "assigned", "vehicle_id": route_data.vehicle_id}}
+    # Insert the route and assign its shipments concurrently
+    await asyncio.gather(
+        delivery_routes_collection.insert_one(route),
+        shipments_collection.update_many(
+            {"id": {"$in": route_data.shipments}},
+            {"$set": {"status": "assigned", "vehicle_id": route_data.vehicle_id}}
+        )
     )
     
-    return DeliveryRoute(**route)
+    return from_db(DeliveryRoute, route)
 
 @app.put("/api/admin/transportation/routes/{route_id}")
-async def update_route_status(route_id: str, status: str, admin_id: str = Depends(get_admin_user)):
-    valid_statuses = ["planned", "in_progress", "completed"]
-    if status not in valid_statuses:
-        raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
-    
-    result = delivery_routes_collection.update_one(
+async def update_route_status(route_id: str, status: RouteStatus, admin_id: str = Depends(get_admin_user)):
+    route = await delivery_routes_collection.find_one_and_update(
         {"id": route_id},
-        {"$set": {"route_status": status}}
+        {"$set": {"route_status": status}},
+        projection=ROUTE_FIELDS,
+        return_document=ReturnDocument.AFTER
     )
-    if result.matched_count == 0:
+    if not route:
         raise HTTPException(status_code=404, detail="Delivery route not found")
     
     # If route is in progress, update shipments to in_transit
     if status == "in_progress":
-        route = delivery_routes_collection.find_one({"id": route_id})
-        if route:
-            shipments_collection.update_many(
-                {"id": {"$in": route["shipments"]}},
-                {"$set": {"status": "in_transit"}}
-            )
+        await shipments_collection.update_many(
+            {"id": {"$in": route["shipments"]}},
+            {"$set": {"status": "in_transit"}}
+        )
     
-    route = delivery_routes_collection.find_one({"id": route_id})
-    return DeliveryRoute(**route)
+    return from_db(DeliveryRoute, route)
 
 # Calculate transportation cost for cart preview
 @app.post("/api/cart/transportation-cost")
 async def calculate_cart_transportation_cost(shipping_address: str, user_id: str = Depends(get_current_user)):
     # Get current cart items
-    cart_items = list(cart_collection.find({"user_id": user_id}))
+    cart_items = await cart_collection.find(
+        {"user_id": user_id},
+        {"_id": 0, "product_id": 1, "quantity": 1, "product.price": 1}
+    ).to_list(length=None)
     
     if not cart_items:
         return {"cost": 0.0, "message": "Cart is empty"}
     
     # Convert cart items to order items format for calculation
+    products_by_id = await fetch_products([item["product_id"] for item in cart_items if "product" not in item])
     order_items = []
     for item in cart_items:
-        product = products_collection.find_one({"id": item["product_id"]})
+        product = item.get("product") or products_by_id.get(item["product_id"])
         if product:
             order_items.append({
                 "product_id": item["product_id"],
@@ -865,7 +1296,7 @@ async def calculate_cart_transportation_cost(shipping_address: str, user_id: str
                 "price": product["price"]
             })
     
-    transport_info = calculate_transportation_cost(shipping_address, order_items)
+    transport_info = await calculate_transportation_cost(shipping_address, order_items)
     
     return {
         "cost": transport_info["cost"],
@@ -1,32 +1,86 @@
 import requests
-import json
+import functools
+import hashlib
+import orjson
+import os
+import pickle
 import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
+from api_test_helpers import (
+    SESSION,
+    fails_on_request_error,
+    flush_report,
+    get_headers,
+    print_test_result,
+    report,
+    run_parallel
+)
+
 # Get the backend URL from the frontend .env file
 BACKEND_URL = "https://8322c09e-45ff-49e6-ae77-baef7fc3717c.preview.emergentagent.com/api"
 
+# Endpoint URLs, built once; templates are filled with str.format
+class Routes:
+    LOGIN = f"{BACKEND_URL}/login"
+    REGISTER = f"{BACKEND_URL}/register"
+    ME = f"{BACKEND_URL}/me"
+    CATEGORIES = f"{BACKEND_URL}/categories"
+    CATEGORY = CATEGORIES + "/{category_id}"
+    PRODUCTS = f"{BACKEND_URL}/products"
+    PRODUCT = PRODUCTS + "/{product_id}"
+    CART = f"{BACKEND_URL}/cart"
+    CART_ITEM = CART + "/{product_id}"
+    CART_TRANSPORTATION_COST = CART + "/transportation-cost"
+    ORDERS = f"{BACKEND_URL}/orders"
+    ORDER_SHIPMENT = ORDERS + "/{order_id}/shipment"
+    ADMIN_ORDERS = f"{BACKEND_URL}/admin/orders"
+    ADMIN_ORDER = ADMIN_ORDERS + "/{order_id}"
+    ADMIN_STATS = f"{BACKEND_URL}/admin/stats"
+    PROVIDERS = f"{BACKEND_URL}/admin/transportation/providers"
+    PROVIDER = PROVIDERS + "/{provider_id}"
+    VEHICLES = f"{BACKEND_URL}/admin/transportation/vehicles"
+    VEHICLE = VEHICLES + "/{vehicle_id}"
+    SHIPMENTS = f"{BACKEND_URL}/admin/transportation/shipments"
+    SHIPMENT = SHIPMENTS + "/{shipment_id}"
+    TRACK_SHIPMENT = f"{BACKEND_URL}/shipments/track/{{tracking_number}}"
+    ROUTES = f"{BACKEND_URL}/admin/transportation/routes"
+    ROUTE = ROUTES + "/{route_id}"
+
+# Idempotent GET responses by (url, role): (fetched_at, response). Keyed on the caller's
+# role rather than its token, since every run logs in and gets a fresh token.
+RESPONSE_CACHE: Dict[tuple, tuple] = {}
+RESPONSE_CACHE_TTL = 30  # seconds
+
+# Opt-in on-disk copy of those responses that survives between local runs (EPHEMERAL_CACHE=1)
+EPHEMERAL_CACHE = os.environ.get("EPHEMERAL_CACHE") == "1"
+EPHEMERAL_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".ephemeral_cache")
+EPHEMERAL_CACHE_TTL = 900  # seconds
+
 # Test credentials
 ADMIN_EMAIL = "admin@shophub.com"
 ADMIN_PASSWORD = "admin123"
 CUSTOMER_EMAIL = "customer1@example.com"
 CUSTOMER_PASSWORD = "customer123"
 
-# Test data
+# Test data; one timestamp suffix shared by every resource this run creates
+RUN_ID = int(time.time())
+TOMORROW = (datetime.utcnow() + timedelta(days=1)).isoformat()
+
 TEST_USER = {
-    "email": f"testuser_{int(time.time())}@example.com",
+    "email": f"testuser_{RUN_ID}@example.com",
     "password": "testpassword123",
     "name": "Test User"
 }
 
 TEST_CATEGORY = {
-    "name": f"Test Category {int(time.time())}",
+    "name": f"Test Category {RUN_ID}",
     "description": "A test category for automated testing"
 }
 
 TEST_PRODUCT = {
-    "name": f"Test Product {int(time.time())}",
+    "name": f"Test Product {RUN_ID}",
     "description": "A test product for automated testing",
     "price": 19.99,
     "image_url": "https://via.placeholder.com/150",
@@ -38,536 +92,399 @@ TEST_ORDER = {
 }
 
 # Helper functions
-def print_test_result(test_name: str, success: bool, details: str = ""):
-    status = "✅ PASSED" if success else "❌ FAILED"
-    print(f"{status} - {test_name}")
-    if details:
-        print(f"  Details: {details}")
-    print()
+def ephemeral_cache_path(key: tuple) -> str:
+    return os.path.join(EPHEMERAL_CACHE_DIR, hashlib.sha256(repr(key).encode("utf-8")).hexdigest())
+
+def load_ephemeral(key: tuple) -> Optional[requests.Response]:
+    path = ephemeral_cache_path(key)
+    try:
+        if time.time() - os.path.getmtime(path) >= EPHEMERAL_CACHE_TTL:
+            return None
+        with open(path, "rb") as cache_file:
+            status_code, content = pickle.load(cache_file)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.url = key[0]
+    return response
+
+def store_ephemeral(key: tuple, response: requests.Response):
+    os.makedirs(EPHEMERAL_CACHE_DIR, exist_ok=True)
+    with open(ephemeral_cache_path(key), "wb") as cache_file:
+        pickle.dump((response.status_code, response.content), cache_file)
+
+def cached_get(
+    url: str,
+    role: str = "anon",
+    headers: Optional[Dict[str, str]] = None,
+    ttl: float = RESPONSE_CACHE_TTL
+) -> requests.Response:
+    """GET an idempotent URL, reusing a successful response fetched within the last `ttl` seconds
+
+    `role` ("admin", "customer" or "anon") names whose view `headers` authenticates.
+    """
+    key = (url, role)
+    cached = RESPONSE_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    response = load_ephemeral(key) if EPHEMERAL_CACHE else None
+    if response is None:
+        response = SESSION.get(url, headers=headers)
+        # Only successes are cached, so a failing endpoint is always re-checked
+        if response.status_code == 200 and EPHEMERAL_CACHE:
+            store_ephemeral(key, response)
+    if response.status_code == 200:
+        RESPONSE_CACHE[key] = (time.monotonic(), response)
+    return response
 
 def login(email: str, password: str) -> Optional[Dict[str, Any]]:
     """Login and return the user data with token"""
-    response = requests.post(
-        f"{BACKEND_URL}/login",
-        json={"email": email, "password": password}
-    )
+    try:
+        response = SESSION.post(
+            Routes.LOGIN,
+            data=orjson.dumps({"email": email, "password": password})
+        )
+    except requests.RequestException as e:
+        report(f"Login failed: {e}")
+        return None
     
     if response.status_code == 200:
-        return response.json()
+        return orjson.loads(response.content)
     else:
-        print(f"Login failed: {response.status_code} - {response.text}")
+        report(f"Login failed: {response.status_code} - {response.text}")
         return None
 
-def get_headers(token: str) -> Dict[str, str]:
-    """Return headers with authorization token"""
-    return {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+def http_test(test_name: str, failure: str, expected_status: int = 200):
+    """Turn a test body into a logged pass/fail check.
+
+    The body returns either a reason string when a precondition is unmet, or
+    (response, on_success) where on_success takes the parsed response body and
+    returns the details line.
+    """
+    def decorator(test):
+        @functools.wraps(test)
+        def wrapper(*args, **kwargs):
+            try:
+                result = test(*args, **kwargs)
+            except requests.RequestException as e:
+                # Timeouts and dropped connections fail this test, not the whole run
+                result = f"{failure}: {e}"
+            if isinstance(result, str):
+                print_test_result(test_name, False, result)
+                return False
+        
+            response, on_success = result
+            success = response.status_code == expected_status
+            if success:
+                details = on_success(orjson.loads(response.content) if response.content else None)
+            else:
+                details = f"{failure}: {response.status_code} - {response.text}"
+        
+            print_test_result(test_name, success, details)
+            return success
+        return wrapper
+    return decorator
 
 # Test classes
 class AuthenticationTests:
     @staticmethod
+    @http_test("User Registration", "Registration failed")
     def test_register():
         """Test user registration"""
-        response = requests.post(
-            f"{BACKEND_URL}/register",
-            json=TEST_USER
-        )
-        
-        success = response.status_code == 200
-        details = ""
+        response = SESSION.post(Routes.REGISTER, data=orjson.dumps(TEST_USER))
         
-        if success:
-            data = response.json()
+        def on_success(data):
             TEST_USER["id"] = data["user"]["id"]
             TEST_USER["token"] = data["token"]
-            details = f"User registered with ID: {TEST_USER['id']}"
-        else:
-            details = f"Registration failed: {response.status_code} - {response.text}"
-        
-        print_test_result("User Registration", success, details)
-        return success
+            return f"User registered with ID: {TEST_USER['id']}"
+        return response, on_success
 
     @staticmethod
+    @http_test("User Login", "Login failed")
     def test_login():
         """Test user login"""
-        response = requests.post(
-            f"{BACKEND_URL}/login",
-            json={"email": TEST_USER["email"], "password": TEST_USER["password"]}
+        response = SESSION.post(
+            Routes.LOGIN,
+            data=orjson.dumps({"email": TEST_USER["email"], "password": TEST_USER["password"]})
         )
         
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            data = response.json()
+        def on_success(data):
             TEST_USER["token"] = data["token"]
-            details = "Login successful, token received"
-        else:
-            details = f"Login failed: {response.status_code} - {response.text}"
-        
-        print_test_result("User Login", success, details)
-        return success
+            return "Login successful, token received"
+        return response, on_success
 
     @staticmethod
+    @http_test("Get User Profile", "Get profile failed")
     def test_get_me():
         """Test getting current user profile"""
         if "token" not in TEST_USER:
-            print_test_result("Get User Profile", False, "No token available, login first")
-            return False
-            
-        response = requests.get(
-            f"{BACKEND_URL}/me",
-            headers=get_headers(TEST_USER["token"])
-        )
+            return "No token available, login first"
         
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            data = response.json()
-            details = f"Retrieved user profile: {data['name']} ({data['email']})"
-        else:
-            details = f"Get profile failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Get User Profile", success, details)
-        return success
+        response = SESSION.get(Routes.ME, headers=get_headers(TEST_USER["token"]))
+        return response, lambda data: f"Retrieved user profile: {data['name']} ({data['email']})"
 
 class CategoryTests:
     category_id = None
-    
+
     @staticmethod
+    @http_test("Create Category (Admin)", "Category creation failed")
     def test_create_category(admin_token: str):
         """Test category creation (admin only)"""
-        response = requests.post(
-            f"{BACKEND_URL}/categories",
+        response = SESSION.post(
+            Routes.CATEGORIES,
             headers=get_headers(admin_token),
-            json=TEST_CATEGORY
+            data=orjson.dumps(TEST_CATEGORY)
         )
         
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            data = response.json()
+        def on_success(data):
             CategoryTests.category_id = data["id"]
-            details = f"Category created with ID: {CategoryTests.category_id}"
-        else:
-            details = f"Category creation failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Create Category (Admin)", success, details)
-        return success
+            return f"Category created with ID: {CategoryTests.category_id}"
+        return response, on_success
 
     @staticmethod
+    @http_test("Get Categories", "Get categories failed")
     def test_get_categories():
         """Test getting all categories"""
-        response = requests.get(f"{BACKEND_URL}/categories")
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            categories = response.json()
-            details = f"Retrieved {len(categories)} categories"
-        else:
-            details = f"Get categories failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Get Categories", success, details)
-        return success
+        response = cached_get(Routes.CATEGORIES)
+        return response, lambda categories: f"Retrieved {len(categories)} categories"
 
     @staticmethod
+    @http_test("Delete Category (Admin)", "Category deletion failed")
     def test_delete_category(admin_token: str):
         """Test category deletion (admin only)"""
         if not CategoryTests.category_id:
-            print_test_result("Delete Category (Admin)", False, "No category ID available")
-            return False
-            
-        response = requests.delete(
-            f"{BACKEND_URL}/categories/{CategoryTests.category_id}",
+            return "No category ID available"
+        
+        response = SESSION.delete(
+            Routes.CATEGORY.format(category_id=CategoryTests.category_id),
             headers=get_headers(admin_token)
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            details = "Category deleted successfully"
-        else:
-            details = f"Category deletion failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Delete Category (Admin)", success, details)
-        return success
+        return response, lambda _: "Category deleted successfully"
 
 class ProductTests:
     product_id = None
-    
+
     @staticmethod
+    @http_test("Create Product (Admin)", "Product creation failed")
     def test_create_product(admin_token: str, category_id: str):
         """Test product creation (admin only)"""
         product_data = TEST_PRODUCT.copy()
         product_data["category_id"] = category_id
         
-        response = requests.post(
-            f"{BACKEND_URL}/products",
+        response = SESSION.post(
+            Routes.PRODUCTS,
             headers=get_headers(admin_token),
-            json=product_data
+            data=orjson.dumps(product_data)
         )
         
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            data = response.json()
+        def on_success(data):
             ProductTests.product_id = data["id"]
-            details = f"Product created with ID: {ProductTests.product_id}"
-        else:
-            details = f"Product creation failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Create Product (Admin)", success, details)
-        return success
+            return f"Product created with ID: {ProductTests.product_id}"
+        return response, on_success
 
     @staticmethod
+    @http_test("Get Products", "Get products failed")
     def test_get_products():
         """Test getting all products"""
-        response = requests.get(f"{BACKEND_URL}/products")
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            products = response.json()
-            details = f"Retrieved {len(products)} products"
-        else:
-            details = f"Get products failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Get Products", success, details)
-        return success
+        response = cached_get(Routes.PRODUCTS)
+        return response, lambda products: f"Retrieved {len(products)} products"
 
     @staticmethod
+    @http_test("Get Product by ID", "Get product failed")
     def test_get_product_by_id():
         """Test getting a product by ID"""
         if not ProductTests.product_id:
-            print_test_result("Get Product by ID", False, "No product ID available")
-            return False
-            
-        response = requests.get(f"{BACKEND_URL}/products/{ProductTests.product_id}")
+            return "No product ID available"
         
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            product = response.json()
-            details = f"Retrieved product: {product['name']}"
-        else:
-            details = f"Get product failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Get Product by ID", success, details)
-        return success
+        response = SESSION.get(Routes.PRODUCT.format(product_id=ProductTests.product_id))
+        return response, lambda product: f"Retrieved product: {product['name']}"
 
     @staticmethod
+    @http_test("Search Products", "Product search failed")
     def test_search_products():
         """Test searching products"""
         search_term = TEST_PRODUCT["name"][:10]  # Use part of the product name
-        response = requests.get(f"{BACKEND_URL}/products?search={search_term}")
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            products = response.json()
-            details = f"Search returned {len(products)} products"
-        else:
-            details = f"Product search failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Search Products", success, details)
-        return success
+        response = SESSION.get(Routes.PRODUCTS, params={"search": search_term})
+        return response, lambda products: f"Search returned {len(products)} products"
 
     @staticmethod
+    @http_test("Filter Products by Category", "Product filter failed")
     def test_filter_products_by_category(category_id: str):
         """Test filtering products by category"""
-        response = requests.get(f"{BACKEND_URL}/products?category={category_id}")
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            products = response.json()
-            details = f"Filter returned {len(products)} products"
-        else:
-            details = f"Product filter failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Filter Products by Category", success, details)
-        return success
+        response = SESSION.get(Routes.PRODUCTS, params={"category": category_id})
+        return response, lambda products: f"Filter returned {len(products)} products"
 
     @staticmethod
+    @http_test("Update Product (Admin)", "Product update failed")
     def test_update_product(admin_token: str, category_id: str):
         """Test updating a product (admin only)"""
         if not ProductTests.product_id:
-            print_test_result("Update Product (Admin)", False, "No product ID available")
-            return False
-            
+            return "No product ID available"
+        
         updated_product = TEST_PRODUCT.copy()
         updated_product["name"] = f"Updated {TEST_PRODUCT['name']}"
         updated_product["price"] = 29.99
         updated_product["category_id"] = category_id
         
-        response = requests.put(
-            f"{BACKEND_URL}/products/{ProductTests.product_id}",
+        response = SESSION.put(
+            Routes.PRODUCT.format(product_id=ProductTests.product_id),
             headers=get_headers(admin_token),
-            json=updated_product
+            data=orjson.dumps(updated_product)
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            product = response.json()
-            details = f"Updated product: {product['name']} with price {product['price']}"
-        else:
-            details = f"Product update failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Update Product (Admin)", success, details)
-        return success
+        return response, lambda product: f"Updated product: {product['name']} with price {product['price']}"
 
     @staticmethod
+    @http_test("Delete Product (Admin)", "Product deletion failed")
     def test_delete_product(admin_token: str):
         """Test deleting a product (admin only)"""
         if not ProductTests.product_id:
-            print_test_result("Delete Product (Admin)", False, "No product ID available")
-            return False
-            
-        response = requests.delete(
-            f"{BACKEND_URL}/products/{ProductTests.product_id}",
+            return "No product ID available"
+        
+        response = SESSION.delete(
+            Routes.PRODUCT.format(product_id=ProductTests.product_id),
             headers=get_headers(admin_token)
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            details = "Product deleted successfully"
-        else:
-            details = f"Product deletion failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Delete Product (Admin)", success, details)
-        return success
+        return response, lambda _: "Product deleted successfully"
 
 class CartTests:
     @staticmethod
+    @http_test("Add to Cart", "Add to cart failed")
     def test_add_to_cart(token: str, product_id: str):
         """Test adding a product to cart"""
-        response = requests.post(
-            f"{BACKEND_URL}/cart",
+        response = SESSION.post(
+            Routes.CART,
             headers=get_headers(token),
-            json={"product_id": product_id, "quantity": 2}
+            data=orjson.dumps({"product_id": product_id, "quantity": 2})
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            details = "Product added to cart successfully"
-        else:
-            details = f"Add to cart failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Add to Cart", success, details)
-        return success
+        return response, lambda _: "Product added to cart successfully"
 
     @staticmethod
+    @fails_on_request_error("Get Cart", failed_result=(False, []))
     def test_get_cart(token: str):
         """Test getting the user's cart"""
-        response = requests.get(
-            f"{BACKEND_URL}/cart",
+        response = SESSION.get(
+            Routes.CART,
             headers=get_headers(token)
         )
         
         success = response.status_code == 200
         details = ""
+        cart_items = []
         
         if success:
-            cart_items = response.json()
+            cart_items = orjson.loads(response.content)
             details = f"Retrieved cart with {len(cart_items)} items"
         else:
             details = f"Get cart failed: {response.status_code} - {response.text}"
         
         print_test_result("Get Cart", success, details)
-        return success, response.json() if success else []
+        return success, cart_items
 
     @staticmethod
+    @http_test("Update Cart Item", "Update cart item failed")
     def test_update_cart_item(token: str, product_id: str):
         """Test updating cart item quantity"""
-        response = requests.put(
-            f"{BACKEND_URL}/cart/{product_id}?quantity=3",
+        response = SESSION.put(
+            Routes.CART_ITEM.format(product_id=product_id),
+            params={"quantity": 3},
             headers=get_headers(token)
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            details = "Cart item quantity updated successfully"
-        else:
-            details = f"Update cart item failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Update Cart Item", success, details)
-        return success
+        return response, lambda _: "Cart item quantity updated successfully"
 
     @staticmethod
+    @http_test("Remove from Cart", "Remove from cart failed")
     def test_remove_from_cart(token: str, product_id: str):
         """Test removing an item from cart"""
-        response = requests.delete(
-            f"{BACKEND_URL}/cart/{product_id}",
+        response = SESSION.delete(
+            Routes.CART_ITEM.format(product_id=product_id),
             headers=get_headers(token)
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            details = "Item removed from cart successfully"
-        else:
-            details = f"Remove from cart failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Remove from Cart", success, details)
-        return success
+        return response, lambda _: "Item removed from cart successfully"
 
 class OrderTests:
     order_id = None
-    
+
     @staticmethod
+    @http_test("Create Order", "Order creation failed")
     def test_create_order(token: str, cart_items: List[Dict[str, Any]]):
         """Test creating an order from cart items"""
         if not cart_items:
-            print_test_result("Create Order", False, "No cart items available")
-            return False
-            
+            return "No cart items available"
+        
         # Extract product_id and quantity from cart items
         items = [{"product_id": item["product_id"], "quantity": item["quantity"]} for item in cart_items]
         
         order_data = TEST_ORDER.copy()
         order_data["items"] = items
         
-        response = requests.post(
-            f"{BACKEND_URL}/orders",
+        response = SESSION.post(
+            Routes.ORDERS,
             headers=get_headers(token),
-            json=order_data
+            data=orjson.dumps(order_data)
         )
         
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            order = response.json()
+        def on_success(order):
             OrderTests.order_id = order["id"]
-            details = f"Order created with ID: {OrderTests.order_id}, total: ${order['total_amount']}"
-        else:
-            details = f"Order creation failed: {response.status_code} - {response.text}"
+            return f"Order created with ID: {OrderTests.order_id}, total: ${order['total_amount']}"
+        return response, on_success
+
+    @staticmethod
+    @http_test("Reject Order Beyond Stock", "Order beyond stock was not rejected", expected_status=409)
+    def test_create_order_insufficient_stock(token: str, product_id: str):
+        """Test that ordering more than the available stock is rejected"""
+        order_data = TEST_ORDER.copy()
+        order_data["items"] = [{"product_id": product_id, "quantity": 10 ** 9}]
         
-        print_test_result("Create Order", success, details)
-        return success
+        response = SESSION.post(
+            Routes.ORDERS,
+            headers=get_headers(token),
+            data=orjson.dumps(order_data)
+        )
+        return response, lambda _: "Order beyond available stock correctly rejected"
 
     @staticmethod
+    @http_test("Get User Orders", "Get orders failed")
     def test_get_user_orders(token: str):
         """Test getting user's order history"""
-        response = requests.get(
-            f"{BACKEND_URL}/orders",
-            headers=get_headers(token)
-        )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            orders = response.json()
-            details = f"Retrieved {len(orders)} orders"
-        else:
-            details = f"Get orders failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Get User Orders", success, details)
-        return success
+        response = SESSION.get(Routes.ORDERS, headers=get_headers(token))
+        return response, lambda orders: f"Retrieved {len(orders)} orders"
 
     @staticmethod
+    @http_test("Get All Orders (Admin)", "Get all orders failed")
     def test_get_all_orders(admin_token: str):
         """Test getting all orders (admin only)"""
-        response = requests.get(
-            f"{BACKEND_URL}/admin/orders",
-            headers=get_headers(admin_token)
-        )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            orders = response.json()
-            details = f"Retrieved {len(orders)} orders as admin"
-        else:
-            details = f"Get all orders failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Get All Orders (Admin)", success, details)
-        return success
+        response = SESSION.get(Routes.ADMIN_ORDERS, headers=get_headers(admin_token))
+        return response, lambda orders: f"Retrieved {len(orders)} orders as admin"
 
     @staticmethod
+    @http_test("Update Order Status (Admin)", "Update order status failed")
     def test_update_order_status(admin_token: str, order_id: str):
         """Test updating order status (admin only)"""
-        response = requests.put(
-            f"{BACKEND_URL}/admin/orders/{order_id}?status=shipped",
+        response = SESSION.put(
+            Routes.ADMIN_ORDER.format(order_id=order_id),
+            params={"status": "shipped"},
             headers=get_headers(admin_token)
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            order = response.json()
-            details = f"Order status updated to: {order['status']}"
-        else:
-            details = f"Update order status failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Update Order Status (Admin)", success, details)
-        return success
+        return response, lambda order: f"Order status updated to: {order['status']}"
 
 class AdminTests:
     @staticmethod
+    @http_test("Get Admin Stats", "Get admin stats failed")
     def test_get_admin_stats(admin_token: str):
         """Test getting admin dashboard statistics"""
-        response = requests.get(
-            f"{BACKEND_URL}/admin/stats",
-            headers=get_headers(admin_token)
-        )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            stats = response.json()
-            details = f"Stats: {stats['total_products']} products, {stats['total_orders']} orders, {stats['total_users']} users, ${stats['total_revenue']} revenue"
-        else:
-            details = f"Get admin stats failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Get Admin Stats", success, details)
-        return success
+        response = cached_get(Routes.ADMIN_STATS, "admin", get_headers(admin_token))
+        return response, lambda stats: f"Stats: {stats['total_products']} products, {stats['total_orders']} orders, {stats['total_users']} users, ${stats['total_revenue']} revenue"
 
     @staticmethod
+    @http_test("Role-Based Access Control", "Role-based access control failed", expected_status=403)
     def test_role_based_access(customer_token: str):
         """Test that customer cannot access admin routes"""
-        # Try to access admin stats with customer token
-        response = requests.get(
-            f"{BACKEND_URL}/admin/stats",
-            headers=get_headers(customer_token)
-        )
-        
-        # Should fail with 403 Forbidden
-        success = response.status_code == 403
-        details = ""
-        
-        if success:
-            details = "Customer correctly denied access to admin route"
-        else:
-            details = f"Role-based access control failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Role-Based Access Control", success, details)
-        return success
+        # Try to access admin stats with customer token; should fail with 403 Forbidden
+        response = SESSION.get(Routes.ADMIN_STATS, headers=get_headers(customer_token))
+        return response, lambda _: "Customer correctly denied access to admin route"
 
 class TransportationTests:
     provider_id = None
@@ -578,7 +495,7 @@ class TransportationTests:
     
     # Test data
     TEST_PROVIDER = {
-        "name": f"Test Provider {int(time.time())}",
+        "name": f"Test Provider {RUN_ID}",
         "service_type": "standard",
         "base_cost": 50.0,
         "cost_per_km": 2.5,
@@ -587,7 +504,7 @@ class TransportationTests:
     }
     
     TEST_VEHICLE = {
-        "vehicle_number": f"TRK-{int(time.time())}",
+        "vehicle_number": f"TRK-{RUN_ID}",
         "driver_name": "Test Driver",
         "vehicle_type": "van",
         "capacity": 1000,
@@ -595,347 +512,224 @@ class TransportationTests:
     }
     
     TEST_ROUTE = {
-        "date": (datetime.utcnow() + timedelta(days=1)).isoformat(),
+        "date": TOMORROW,
         "total_distance": 45.5,
         "estimated_duration": 120  # minutes
     }
     
     @staticmethod
+    @http_test("Create Transportation Provider (Admin)", "Transportation provider creation failed")
     def test_create_transportation_provider(admin_token: str):
         """Test creating a transportation provider (admin only)"""
-        response = requests.post(
-            f"{BACKEND_URL}/admin/transportation/providers",
+        response = SESSION.post(
+            Routes.PROVIDERS,
             headers=get_headers(admin_token),
-            json=TransportationTests.TEST_PROVIDER
+            data=orjson.dumps(TransportationTests.TEST_PROVIDER)
         )
         
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            data = response.json()
+        def on_success(data):
             TransportationTests.provider_id = data["id"]
-            details = f"Transportation provider created with ID: {TransportationTests.provider_id}"
-        else:
-            details = f"Transportation provider creation failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Create Transportation Provider (Admin)", success, details)
-        return success
-    
+            return f"Transportation provider created with ID: {TransportationTests.provider_id}"
+        return response, on_success
+
     @staticmethod
+    @http_test("Get Transportation Providers (Admin)", "Get transportation providers failed")
     def test_get_transportation_providers(admin_token: str):
         """Test getting all transportation providers (admin only)"""
-        response = requests.get(
-            f"{BACKEND_URL}/admin/transportation/providers",
-            headers=get_headers(admin_token)
-        )
-        
-        success = response.status_code == 200
-        details = ""
+        response = cached_get(Routes.PROVIDERS, "admin", get_headers(admin_token))
         
-        if success:
-            providers = response.json()
+        def on_success(providers):
             details = f"Retrieved {len(providers)} transportation providers"
-            
             # If we don't have a provider ID yet, use the first one from the list
             if not TransportationTests.provider_id and providers:
                 TransportationTests.provider_id = providers[0]["id"]
                 details += f", using provider ID: {TransportationTests.provider_id}"
-        else:
-            details = f"Get transportation providers failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Get Transportation Providers (Admin)", success, details)
-        return success
-    
+            return details
+        return response, on_success
+
     @staticmethod
+    @http_test("Update Transportation Provider (Admin)", "Provider update failed")
     def test_update_transportation_provider(admin_token: str):
         """Test updating a transportation provider (admin only)"""
         if not TransportationTests.provider_id:
-            print_test_result("Update Transportation Provider (Admin)", False, "No provider ID available")
-            return False
+            return "No provider ID available"
         
         updated_provider = TransportationTests.TEST_PROVIDER.copy()
         updated_provider["name"] = f"Updated {TransportationTests.TEST_PROVIDER['name']}"
         updated_provider["base_cost"] = 60.0
         
-        response = requests.put(
-            f"{BACKEND_URL}/admin/transportation/providers/{TransportationTests.provider_id}",
+        response = SESSION.put(
+            Routes.PROVIDER.format(provider_id=TransportationTests.provider_id),
             headers=get_headers(admin_token),
-            json=updated_provider
+            data=orjson.dumps(updated_provider)
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            provider = response.json()
-            details = f"Updated provider: {provider['name']} with base cost {provider['base_cost']}"
-        else:
-            details = f"Provider update failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Update Transportation Provider (Admin)", success, details)
-        return success
-    
+        return response, lambda provider: f"Updated provider: {provider['name']} with base cost {provider['base_cost']}"
+
     @staticmethod
+    @http_test("Delete Transportation Provider (Admin)", "Provider deletion failed")
     def test_delete_transportation_provider(admin_token: str):
         """Test deleting (deactivating) a transportation provider (admin only)"""
         if not TransportationTests.provider_id:
-            print_test_result("Delete Transportation Provider (Admin)", False, "No provider ID available")
-            return False
+            return "No provider ID available"
         
-        response = requests.delete(
-            f"{BACKEND_URL}/admin/transportation/providers/{TransportationTests.provider_id}",
+        response = SESSION.delete(
+            Routes.PROVIDER.format(provider_id=TransportationTests.provider_id),
             headers=get_headers(admin_token)
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            details = "Transportation provider deactivated successfully"
-        else:
-            details = f"Provider deletion failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Delete Transportation Provider (Admin)", success, details)
-        return success
-    
+        return response, lambda _: "Transportation provider deactivated successfully"
+
     @staticmethod
+    @http_test("Create Vehicle (Admin)", "Vehicle creation failed")
     def test_create_vehicle(admin_token: str):
         """Test creating a vehicle (admin only)"""
         if not TransportationTests.provider_id:
-            print_test_result("Create Vehicle (Admin)", False, "No provider ID available")
-            return False
+            return "No provider ID available"
         
         vehicle_data = TransportationTests.TEST_VEHICLE.copy()
         vehicle_data["provider_id"] = TransportationTests.provider_id
         
-        response = requests.post(
-            f"{BACKEND_URL}/admin/transportation/vehicles",
+        response = SESSION.post(
+            Routes.VEHICLES,
             headers=get_headers(admin_token),
-            json=vehicle_data
+            data=orjson.dumps(vehicle_data)
         )
         
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            data = response.json()
+        def on_success(data):
             TransportationTests.vehicle_id = data["id"]
-            details = f"Vehicle created with ID: {TransportationTests.vehicle_id}"
-        else:
-            details = f"Vehicle creation failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Create Vehicle (Admin)", success, details)
-        return success
-    
+            return f"Vehicle created with ID: {TransportationTests.vehicle_id}"
+        return response, on_success
+
     @staticmethod
+    @http_test("Get Vehicles (Admin)", "Get vehicles failed")
     def test_get_vehicles(admin_token: str):
         """Test getting all vehicles (admin only)"""
-        response = requests.get(
-            f"{BACKEND_URL}/admin/transportation/vehicles",
-            headers=get_headers(admin_token)
-        )
+        response = cached_get(Routes.VEHICLES, "admin", get_headers(admin_token))
         
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            vehicles = response.json()
+        def on_success(vehicles):
             details = f"Retrieved {len(vehicles)} vehicles"
-            
             # If we don't have a vehicle ID yet, use the first one from the list
             if not TransportationTests.vehicle_id and vehicles:
                 TransportationTests.vehicle_id = vehicles[0]["id"]
                 details += f", using vehicle ID: {TransportationTests.vehicle_id}"
-        else:
-            details = f"Get vehicles failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Get Vehicles (Admin)", success, details)
-        return success
-    
+            return details
+        return response, on_success
+
     @staticmethod
+    @http_test("Update Vehicle (Admin)", "Vehicle update failed")
     def test_update_vehicle(admin_token: str):
         """Test updating a vehicle (admin only)"""
         if not TransportationTests.vehicle_id or not TransportationTests.provider_id:
-            print_test_result("Update Vehicle (Admin)", False, "No vehicle ID or provider ID available")
-            return False
+            return "No vehicle ID or provider ID available"
         
         updated_vehicle = TransportationTests.TEST_VEHICLE.copy()
         updated_vehicle["provider_id"] = TransportationTests.provider_id
         updated_vehicle["driver_name"] = f"Updated {TransportationTests.TEST_VEHICLE['driver_name']}"
         updated_vehicle["current_location"] = "Updated Location"
         
-        response = requests.put(
-            f"{BACKEND_URL}/admin/transportation/vehicles/{TransportationTests.vehicle_id}",
+        response = SESSION.put(
+            Routes.VEHICLE.format(vehicle_id=TransportationTests.vehicle_id),
             headers=get_headers(admin_token),
-            json=updated_vehicle
+            data=orjson.dumps(updated_vehicle)
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            vehicle = response.json()
-            details = f"Updated vehicle: {vehicle['vehicle_number']} with driver {vehicle['driver_name']}"
-        else:
-            details = f"Vehicle update failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Update Vehicle (Admin)", success, details)
-        return success
-    
+        return response, lambda vehicle: f"Updated vehicle: {vehicle['vehicle_number']} with driver {vehicle['driver_name']}"
+
     @staticmethod
+    @http_test("Delete Vehicle (Admin)", "Vehicle deletion failed")
     def test_delete_vehicle(admin_token: str):
         """Test deleting (deactivating) a vehicle (admin only)"""
         if not TransportationTests.vehicle_id:
-            print_test_result("Delete Vehicle (Admin)", False, "No vehicle ID available")
-            return False
+            return "No vehicle ID available"
         
-        response = requests.delete(
-            f"{BACKEND_URL}/admin/transportation/vehicles/{TransportationTests.vehicle_id}",
+        response = SESSION.delete(
+            Routes.VEHICLE.format(vehicle_id=TransportationTests.vehicle_id),
             headers=get_headers(admin_token)
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            details = "Vehicle deactivated successfully"
-        else:
-            details = f"Vehicle deletion failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Delete Vehicle (Admin)", success, details)
-        return success
-    
+        return response, lambda _: "Vehicle deactivated successfully"
+
     @staticmethod
+    @http_test("Get Shipments (Admin)", "Get shipments failed")
     def test_get_shipments(admin_token: str):
         """Test getting all shipments (admin only)"""
-        response = requests.get(
-            f"{BACKEND_URL}/admin/transportation/shipments",
-            headers=get_headers(admin_token)
-        )
-        
-        success = response.status_code == 200
-        details = ""
+        response = SESSION.get(Routes.SHIPMENTS, headers=get_headers(admin_token))
         
-        if success:
-            shipments = response.json()
+        def on_success(shipments):
             details = f"Retrieved {len(shipments)} shipments"
-            
             # If we have shipments, save the first one's ID and tracking number for later tests
             if shipments:
                 TransportationTests.shipment_id = shipments[0]["id"]
                 TransportationTests.tracking_number = shipments[0]["tracking_number"]
                 details += f", using shipment ID: {TransportationTests.shipment_id}"
-        else:
-            details = f"Get shipments failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Get Shipments (Admin)", success, details)
-        return success
-    
+            return details
+        return response, on_success
+
     @staticmethod
+    @http_test("Track Shipment", "Track shipment failed")
     def test_track_shipment():
         """Test tracking a shipment by tracking number (public endpoint)"""
         if not TransportationTests.tracking_number:
-            print_test_result("Track Shipment", False, "No tracking number available")
-            return False
+            return "No tracking number available"
         
-        response = requests.get(
-            f"{BACKEND_URL}/shipments/track/{TransportationTests.tracking_number}"
-        )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            tracking_info = response.json()
-            details = f"Retrieved tracking info for shipment with status: {tracking_info['shipment']['status']}"
-        else:
-            details = f"Track shipment failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Track Shipment", success, details)
-        return success
-    
+        response = SESSION.get(Routes.TRACK_SHIPMENT.format(tracking_number=TransportationTests.tracking_number))
+        return response, lambda tracking_info: f"Retrieved tracking info for shipment with status: {tracking_info['shipment']['status']}"
+
     @staticmethod
+    @http_test("Get Order Shipment", "Get order shipment failed")
     def test_get_order_shipment(customer_token: str, order_id: str):
         """Test getting shipment info for a specific order"""
         if not order_id:
-            print_test_result("Get Order Shipment", False, "No order ID available")
-            return False
-        
-        response = requests.get(
-            f"{BACKEND_URL}/orders/{order_id}/shipment",
-            headers=get_headers(customer_token)
-        )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            shipment_info = response.json()
-            details = f"Retrieved shipment info for order with tracking number: {shipment_info['shipment']['tracking_number']}"
-        else:
-            details = f"Get order shipment failed: {response.status_code} - {response.text}"
+            return "No order ID available"
         
-        print_test_result("Get Order Shipment", success, details)
-        return success
-    
+        response = SESSION.get(Routes.ORDER_SHIPMENT.format(order_id=order_id), headers=get_headers(customer_token))
+        return response, lambda shipment_info: f"Retrieved shipment info for order with tracking number: {shipment_info['shipment']['tracking_number']}"
+
     @staticmethod
+    @http_test("Update Shipment Status (Admin)", "Shipment status update failed")
     def test_update_shipment_status(admin_token: str):
         """Test updating a shipment status (admin only)"""
         if not TransportationTests.shipment_id:
-            print_test_result("Update Shipment Status (Admin)", False, "No shipment ID available")
-            return False
+            return "No shipment ID available"
         
-        response = requests.put(
-            f"{BACKEND_URL}/admin/transportation/shipments/{TransportationTests.shipment_id}",
+        response = SESSION.put(
+            Routes.SHIPMENT.format(shipment_id=TransportationTests.shipment_id),
             headers=get_headers(admin_token),
-            json={"status": "in_transit", "delivery_notes": "Test status update"}
+            data=orjson.dumps({"status": "in_transit", "delivery_notes": "Test status update"})
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            shipment = response.json()
-            details = f"Updated shipment status to: {shipment['status']}"
-        else:
-            details = f"Shipment status update failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Update Shipment Status (Admin)", success, details)
-        return success
+        return response, lambda shipment: f"Updated shipment status to: {shipment['status']}"
     
     @staticmethod
+    @fails_on_request_error("Create Delivery Route (Admin)")
     def test_create_delivery_route(admin_token: str):
         """Test creating a delivery route (admin only)"""
         if not TransportationTests.vehicle_id:
             print_test_result("Create Delivery Route (Admin)", False, "No vehicle ID available")
             return False
         
-        # Get an order ID
-        response = requests.get(
-            f"{BACKEND_URL}/admin/orders",
+        # Get an order ID; one is enough to know orders exist
+        response = SESSION.get(
+            Routes.ADMIN_ORDERS,
+            params={"page_size": 1},
             headers=get_headers(admin_token)
         )
         
-        if response.status_code != 200 or not response.json():
+        if response.status_code != 200 or not orjson.loads(response.content):
             print_test_result("Create Delivery Route (Admin)", False, "No orders available to create test shipment")
             return False
         
         # Create a new shipment manually in the database
         import uuid
-        from datetime import datetime, timedelta
         
         # Get a provider ID
-        response = requests.get(
-            f"{BACKEND_URL}/admin/transportation/providers",
+        response = SESSION.get(
+            Routes.PROVIDERS,
             headers=get_headers(admin_token)
         )
         
-        if response.status_code != 200 or not response.json():
+        providers = orjson.loads(response.content) if response.status_code == 200 else None
+        if not providers:
             print_test_result("Create Delivery Route (Admin)", False, "No providers available")
             return False
         
-        provider_id = response.json()[0]["id"]
+        provider_id = providers[0]["id"]
         
         # Create a mock route with a random shipment ID
         shipment_id = str(uuid.uuid4())  # Generate a random ID
@@ -946,10 +740,10 @@ class TransportationTests:
         
         # For testing purposes, we'll just check if the API accepts the request
         # In a real scenario, we would need to create a valid shipment first
-        response = requests.post(
-            f"{BACKEND_URL}/admin/transportation/routes",
+        response = SESSION.post(
+            Routes.ROUTES,
             headers=get_headers(admin_token),
-            json=route_data
+            data=orjson.dumps(route_data)
         )
         
         # Since we're using a random shipment ID, we expect a 404 error
@@ -966,74 +760,57 @@ class TransportationTests:
         return success
     
     @staticmethod
+    @http_test("Get Delivery Routes (Admin)", "Get delivery routes failed")
     def test_get_delivery_routes(admin_token: str):
         """Test getting all delivery routes (admin only)"""
-        response = requests.get(
-            f"{BACKEND_URL}/admin/transportation/routes",
-            headers=get_headers(admin_token)
-        )
+        response = SESSION.get(Routes.ROUTES, headers=get_headers(admin_token))
         
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            routes = response.json()
+        def on_success(routes):
             details = f"Retrieved {len(routes)} delivery routes"
-            
             # If we don't have a route ID yet, use the first one from the list
             if not TransportationTests.route_id and routes:
                 TransportationTests.route_id = routes[0]["id"]
                 details += f", using route ID: {TransportationTests.route_id}"
-        else:
-            details = f"Get delivery routes failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Get Delivery Routes (Admin)", success, details)
-        return success
-    
+            return details
+        return response, on_success
+
     @staticmethod
+    @http_test("Update Route Status (Admin)", "Route status update failed")
     def test_update_route_status(admin_token: str):
         """Test updating a delivery route status (admin only)"""
         if not TransportationTests.route_id:
-            print_test_result("Update Route Status (Admin)", False, "No route ID available")
-            return False
+            return "No route ID available"
         
-        response = requests.put(
-            f"{BACKEND_URL}/admin/transportation/routes/{TransportationTests.route_id}?status=in_progress",
+        response = SESSION.put(
+            Routes.ROUTE.format(route_id=TransportationTests.route_id),
+            params={"status": "in_progress"},
             headers=get_headers(admin_token)
         )
-        
-        success = response.status_code == 200
-        details = ""
-        
-        if success:
-            route = response.json()
-            details = f"Updated route status to: {route['route_status']}"
-        else:
-            details = f"Route status update failed: {response.status_code} - {response.text}"
-        
-        print_test_result("Update Route Status (Admin)", success, details)
-        return success
+        return response, lambda route: f"Updated route status to: {route['route_status']}"
     
     @staticmethod
+    @fails_on_request_error("Calculate Transportation Cost")
     def test_calculate_transportation_cost(customer_token: str):
         """Test calculating transportation cost for cart"""
         # First, add an item to the cart
-        response = requests.get(
-            f"{BACKEND_URL}/products",
+        response = SESSION.get(
+            Routes.PRODUCTS,
+            params={"page_size": 1},
             headers=get_headers(customer_token)
         )
         
-        if response.status_code != 200 or not response.json():
+        products = orjson.loads(response.content) if response.status_code == 200 else None
+        if not products:
             print_test_result("Calculate Transportation Cost", False, "No products available")
             return False
         
-        product_id = response.json()[0]["id"]
+        product_id = products[0]["id"]
         
         # Add product to cart
-        response = requests.post(
-            f"{BACKEND_URL}/cart",
+        response = SESSION.post(
+            Routes.CART,
             headers=get_headers(customer_token),
-            json={"product_id": product_id, "quantity": 1}
+            data=orjson.dumps({"product_id": product_id, "quantity": 1})
         )
         
         if response.status_code != 200:
@@ -1043,8 +820,9 @@ class TransportationTests:
         # Now calculate transportation cost
         shipping_address = "123 Test Street, Test City, Test Country"
         
-        response = requests.post(
-            f"{BACKEND_URL}/cart/transportation-cost?shipping_address={shipping_address}",
+        response = SESSION.post(
+            Routes.CART_TRANSPORTATION_COST,
+            params={"shipping_address": shipping_address},
             headers=get_headers(customer_token)
         )
         
@@ -1052,7 +830,7 @@ class TransportationTests:
         details = ""
         
         if success:
-            cost_info = response.json()
+            cost_info = orjson.loads(response.content)
             cost = cost_info.get('cost', 0)
             provider = cost_info.get('provider_name', 'Unknown Provider')
             details = f"Calculated transportation cost: ${cost}, provider: {provider}"
@@ -1062,43 +840,46 @@ class TransportationTests:
         print_test_result("Calculate Transportation Cost", success, details)
         return success
 
-def run_all_tests():
-    print("=" * 80)
-    print("STARTING BACKEND API TESTS")
-    print("=" * 80)
-    print(f"Backend URL: {BACKEND_URL}")
-    print("-" * 80)
+def run_tests():
+    report("=" * 80)
+    report("STARTING BACKEND API TESTS")
+    report("=" * 80)
+    report(f"Backend URL: {BACKEND_URL}")
+    report("-" * 80)
     
     # Login as admin and customer
-    print("Logging in as admin and customer...")
-    admin_data = login(ADMIN_EMAIL, ADMIN_PASSWORD)
-    customer_data = login(CUSTOMER_EMAIL, CUSTOMER_PASSWORD)
+    report("Logging in as admin and customer...")
+    admin_data, customer_data = run_parallel(
+        (login, ADMIN_EMAIL, ADMIN_PASSWORD),
+        (login, CUSTOMER_EMAIL, CUSTOMER_PASSWORD)
+    )
     
     if not admin_data or not customer_data:
-        print("❌ CRITICAL ERROR: Could not log in with test credentials")
+        report("❌ CRITICAL ERROR: Could not log in with test credentials")
         return
     
     admin_token = admin_data["token"]
     customer_token = customer_data["token"]
     
-    print("-" * 80)
-    print("1. AUTHENTICATION TESTS")
-    print("-" * 80)
+    report("-" * 80)
+    report("1. AUTHENTICATION TESTS")
+    report("-" * 80)
     auth_tests = AuthenticationTests()
     auth_tests.test_register()
     auth_tests.test_login()
     auth_tests.test_get_me()
     
-    print("-" * 80)
-    print("2. CATEGORY TESTS")
-    print("-" * 80)
+    report("-" * 80)
+    report("2. CATEGORY TESTS")
+    report("-" * 80)
     category_tests = CategoryTests()
+    
     category_tests.test_get_categories()
     
-    # Get an existing category for product tests
-    response = requests.get(f"{BACKEND_URL}/categories")
+    # Get an existing category for product tests (served from the listing just fetched)
+    response = cached_get(Routes.CATEGORIES)
     if response.status_code == 200:
-        categories = response.json()
+        categories = orjson.loads(response.content)
         if categories:
             existing_category_id = categories[0]["id"]
         else:
@@ -1106,22 +887,27 @@ def run_all_tests():
             category_tests.test_create_category(admin_token)
             existing_category_id = CategoryTests.category_id
     else:
-        print("❌ CRITICAL ERROR: Could not get categories")
+        report("❌ CRITICAL ERROR: Could not get categories")
         return
     
     # Test category creation and deletion
     category_tests.test_create_category(admin_token)
     category_tests.test_delete_category(admin_token)
     
-    print("-" * 80)
-    print("3. PRODUCT TESTS")
-    print("-" * 80)
+    report("-" * 80)
+    report("3. PRODUCT TESTS")
+    report("-" * 80)
     product_tests = ProductTests()
-    product_tests.test_get_products()
-    product_tests.test_create_product(admin_token, existing_category_id)
-    product_tests.test_get_product_by_id()
-    product_tests.test_search_products()
-    product_tests.test_filter_products_by_category(existing_category_id)
+    run_parallel(
+        (product_tests.test_get_products,),
+        (product_tests.test_create_product, admin_token, existing_category_id)
+    )
+    # Reads of the new product run together, before it is updated
+    run_parallel(
+        (product_tests.test_get_product_by_id,),
+        (product_tests.test_search_products,),
+        (product_tests.test_filter_products_by_category, existing_category_id)
+    )
     product_tests.test_update_product(admin_token, existing_category_id)
     
     # Save product ID for cart tests
@@ -1129,26 +915,26 @@ def run_all_tests():
     
     # Get an existing product if test product creation failed
     if not test_product_id:
-        response = requests.get(f"{BACKEND_URL}/products")
+        response = cached_get(Routes.PRODUCTS)
         if response.status_code == 200:
-            products = response.json()
+            products = orjson.loads(response.content)
             if products:
                 test_product_id = products[0]["id"]
             else:
-                print("❌ CRITICAL ERROR: No products available for cart tests")
+                report("❌ CRITICAL ERROR: No products available for cart tests")
                 return
     
-    print("-" * 80)
-    print("4. CART TESTS")
-    print("-" * 80)
+    report("-" * 80)
+    report("4. CART TESTS")
+    report("-" * 80)
     cart_tests = CartTests()
     cart_tests.test_add_to_cart(customer_token, test_product_id)
     success, cart_items = cart_tests.test_get_cart(customer_token)
     cart_tests.test_update_cart_item(customer_token, test_product_id)
     
-    print("-" * 80)
-    print("5. ORDER TESTS")
-    print("-" * 80)
+    report("-" * 80)
+    report("5. ORDER TESTS")
+    report("-" * 80)
     order_tests = OrderTests()
     
     # Add item to cart again if needed for order test
@@ -1159,46 +945,58 @@ def run_all_tests():
     order_id = None
     if cart_items:
         order_tests.test_create_order(customer_token, cart_items)
-        order_tests.test_get_user_orders(customer_token)
-        order_tests.test_get_all_orders(admin_token)
-        
-        if OrderTests.order_id:
-            order_id = OrderTests.order_id
-            order_tests.test_update_order_status(admin_token, order_id)
+        order_id = OrderTests.order_id
+        
+        reads = [
+            (order_tests.test_get_user_orders, customer_token),
+            (order_tests.test_get_all_orders, admin_token),
+            (order_tests.test_create_order_insufficient_stock, customer_token, test_product_id)
+        ]
+        if order_id:
+            reads.append((order_tests.test_update_order_status, admin_token, order_id))
+        run_parallel(*reads)
     
-    print("-" * 80)
-    print("6. ADMIN TESTS")
-    print("-" * 80)
+    report("-" * 80)
+    report("6. ADMIN TESTS")
+    report("-" * 80)
     admin_tests = AdminTests()
-    admin_tests.test_get_admin_stats(admin_token)
-    admin_tests.test_role_based_access(customer_token)
+    run_parallel(
+        (admin_tests.test_get_admin_stats, admin_token),
+        (admin_tests.test_role_based_access, customer_token)
+    )
     
-    print("-" * 80)
-    print("7. TRANSPORTATION MANAGEMENT TESTS")
-    print("-" * 80)
+    report("-" * 80)
+    report("7. TRANSPORTATION MANAGEMENT TESTS")
+    report("-" * 80)
     transportation_tests = TransportationTests()
     
+    # The list endpoints are independent reads, so fetch them together up front
+    run_parallel(
+        (transportation_tests.test_get_transportation_providers, admin_token),
+        (transportation_tests.test_get_vehicles, admin_token),
+        (transportation_tests.test_get_shipments, admin_token),
+        (transportation_tests.test_get_delivery_routes, admin_token)
+    )
+    
     # Provider tests
-    transportation_tests.test_get_transportation_providers(admin_token)
     transportation_tests.test_create_transportation_provider(admin_token)
     transportation_tests.test_update_transportation_provider(admin_token)
     
     # Vehicle tests
-    transportation_tests.test_get_vehicles(admin_token)
     transportation_tests.test_create_vehicle(admin_token)
     transportation_tests.test_update_vehicle(admin_token)
     
     # Shipment tests
-    transportation_tests.test_get_shipments(admin_token)
+    shipment_tests = []
     if TransportationTests.tracking_number:
-        transportation_tests.test_track_shipment()
+        shipment_tests.append((transportation_tests.test_track_shipment,))
     if order_id:
-        transportation_tests.test_get_order_shipment(customer_token, order_id)
+        shipment_tests.append((transportation_tests.test_get_order_shipment, customer_token, order_id))
     if TransportationTests.shipment_id:
-        transportation_tests.test_update_shipment_status(admin_token)
+        shipment_tests.append((transportation_tests.test_update_shipment_status, admin_token))
+    run_parallel(*shipment_tests)
     
     # Route tests
-    transportation_tests.test_get_delivery_routes(admin_token)
     transportation_tests.test_create_delivery_route(admin_token)
     if TransportationTests.route_id:
         transportation_tests.test_update_route_status(admin_token)
@@ -1220,9 +1018,15 @@ def run_all_tests():
     if test_product_id == ProductTests.product_id:  # Only delete if it's our test product
         product_tests.test_delete_product(admin_token)
     
-    print("=" * 80)
-    print("BACKEND API TESTS COMPLETED")
-    print("=" * 80)
+    report("=" * 80)
+    report("BACKEND API TESTS COMPLETED")
+    report("=" * 80)
+
+def run_all_tests():
+    try:
+        run_tests()
+    finally:
+        flush_report()
 
 if __name__ == "__main__":
     run_all_tests()
\ No newline at end of file